@@ -1,76 +1,625 @@
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+
 from flask import Flask, request, jsonify, render_template_string
 
 app = Flask(__name__)
 
 # ------------------------------
-# Data Structure: Dynamic Memory Allocation (First Fit)
+# Data Structure: Dynamic Memory Allocation (First / Next / Best / Worst Fit, Buddy System)
 # ------------------------------
 
-class MemoryBlock:
-    def __init__(self, start, size, allocated=False, process_id=None):
-        self.start = start
-        self.size = size
-        self.allocated = allocated
-        self.process_id = process_id
-        self.end = start + size - 1
+class BlockTable:
+    """Memory map stored as parallel columns indexed by slot number.
+
+    start/size/allocated are array('q') columns and prev/next link the slots
+    in address order (NIL = -1), so a block costs five machine words plus a
+    process_id reference and no Python object of its own. Released slots
+    are chained through next and reused by new.
+    """
+    NIL = -1
+
+    def __init__(self):
+        self.start = array('q')
+        self.size = array('q')
+        self.allocated = array('q')
+        self.process_id = []  # owner of each slot, None while free
+        self.prev = array('q')
+        self.next = array('q')
+        self.spare = self.NIL  # head of the released-slot chain
+
+    def new(self, start, size, prev=NIL, nxt=NIL):
+        """Slot for a free block, reusing a released slot when there is one"""
+        slot = self.spare
+        if slot == self.NIL:
+            slot = len(self.start)
+            for column in (self.start, self.size, self.allocated, self.prev, self.next):
+                column.append(0)
+            self.process_id.append(None)
+        else:
+            self.spare = self.next[slot]
+        self.start[slot], self.size[slot], self.allocated[slot] = start, size, 0
+        self.prev[slot], self.next[slot] = prev, nxt
+        return slot
+
+    def release(self, slot):
+        self.process_id[slot] = None
+        self.next[slot] = self.spare
+        self.spare = slot
+
+    def unlink(self, slot):
+        """Drop slot from the address chain (never the head) and release it"""
+        prev, nxt = self.prev[slot], self.next[slot]
+        self.next[prev] = nxt
+        if nxt != self.NIL:
+            self.prev[nxt] = prev
+        self.release(slot)
 
-    def to_dict(self):
+    def to_dict(self, slot):
+        start, size = self.start[slot], self.size[slot]
         return {
-            "start": self.start,
-            "end": self.end,
-            "size": self.size,
-            "allocated": self.allocated,
-            "process_id": self.process_id
+            "start": start,
+            "end": start + size - 1,
+            "size": size,
+            "allocated": bool(self.allocated[slot]),
+            "process_id": self.process_id[slot]
         }
 
 
-class MemoryManager:
-    def __init__(self, total_size):
-        self.total_size = total_size
-        self.blocks = [MemoryBlock(0, total_size)]  # initially one free block
+class Allocator:
+    """Message-level API shared by the allocation engines.
+
+    Engines implement alloc_block / free_block (returning True on success),
+    rows(), largest_free() and free_count(), keep free_units and scan_steps
+    up to date, and call record() for every block they create, change or
+    remove; everything else is built on top of those.
+    """
+    CHANGE_LOG_SIZE = 10000
+
+    def __init__(self):
+        self.version = 0          # bumped once per successful mutation
+        self.changes = deque()    # (version, start, block dict or None if removed)
+        self.log_floor = 0        # changes at or below this version were dropped
+        self.alloc_requests = 0
+        self.alloc_failures = 0
+        self.frees = 0
+        self.scan_steps = 0  # free-list entries examined by allocations
 
     def allocate(self, process_id, size):
-        """Allocate memory using First Fit strategy"""
-        for block in self.blocks:
-            if not block.allocated and block.size >= size:
-                new_block = MemoryBlock(block.start, size, True, process_id)
-                block.start += size
-                block.size -= size
-                if block.size == 0:
-                    self.blocks.remove(block)
-                self.blocks.append(new_block)
-                self.blocks.sort(key=lambda x: x.start)
-                return f"Process {process_id} allocated {size} units."
-        return "Insufficient memory to allocate."
+        if size <= 0:
+            return "Memory size must be positive."
+        if not self.try_allocate(process_id, size):
+            return "Insufficient memory to allocate."
+        return f"Process {process_id} allocated {size} units."
 
     def deallocate(self, process_id):
         """Free memory of a process"""
-        for block in self.blocks:
-            if block.allocated and block.process_id == process_id:
-                block.allocated = False
-                block.process_id = None
-                self.merge_free_blocks()
-                return f"Process {process_id} deallocated successfully."
-        return f"No block found for Process {process_id}."
-
-    def merge_free_blocks(self):
-        """Merge adjacent free blocks"""
-        self.blocks.sort(key=lambda x: x.start)
-        merged = []
-        for block in self.blocks:
-            if merged and not block.allocated and not merged[-1].allocated and merged[-1].end + 1 == block.start:
-                merged[-1].end = block.end
-                merged[-1].size += block.size
+        if not self.try_deallocate(process_id):
+            return f"No block found for Process {process_id}."
+        return f"Process {process_id} deallocated successfully."
+
+    def try_allocate(self, process_id, size):
+        self.alloc_requests += 1
+        if self.alloc_block(process_id, size):
+            self.version += 1
+            return True
+        self.alloc_failures += 1
+        return False
+
+    def try_deallocate(self, process_id):
+        if self.free_block(process_id):
+            self.frees += 1
+            self.version += 1
+            return True
+        return False
+
+    def record(self, start, block=None):
+        """Log the state of the block at start (None = removed) for the pending version"""
+        if len(self.changes) == self.CHANGE_LOG_SIZE:
+            self.log_floor = self.changes.popleft()[0]
+        self.changes.append((self.version + 1, start, block))
+
+    def changes_since(self, since):
+        """Blocks changed after version `since`, or None if the log no longer covers it"""
+        if since < self.log_floor or since > self.version:
+            return None
+        latest = {}
+        for version, start, block in reversed(self.changes):
+            if version <= since:
+                break
+            latest.setdefault(start, block)
+        return {
+            "changed": sorted((b for b in latest.values() if b), key=lambda x: x["start"]),
+            "removed": sorted(start for start, b in latest.items() if b is None),
+        }
+
+    def metrics(self):
+        """Allocator health numbers, all derived from incrementally kept counters"""
+        largest = self.largest_free()
+        return {
+            "total_size": self.total_size,
+            "free_units": self.free_units,
+            "free_blocks": self.free_count(),
+            "largest_free_block": largest,
+            # Share of free memory unusable by a request as large as all of it
+            "external_fragmentation": 1 - largest / self.free_units if self.free_units else 0.0,
+            "alloc_requests": self.alloc_requests,
+            "alloc_failures": self.alloc_failures,
+            "alloc_failure_rate": self.alloc_failures / self.alloc_requests if self.alloc_requests else 0.0,
+            "frees": self.frees,
+            "avg_scan_length": self.scan_steps / self.alloc_requests if self.alloc_requests else 0.0,
+        }
+
+    def apply_trace(self, events):
+        """Apply a whole alloc/free trace in one pass and return summary stats.
+
+        Each event is {"op": "alloc", "pid": p, "size": n} / {"op": "free", "pid": p}
+        or the equivalent list form ["alloc", p, n] / ["free", p]. Integer
+        pids are stored as strings, the same as ?pid= on /allocate; any other
+        pid type counts as invalid.
+        """
+        summary = {"events": 0, "allocated": 0, "alloc_failed": 0,
+                   "freed": 0, "free_failed": 0, "invalid": 0, "failed": []}
+        for i, event in enumerate(events):
+            summary["events"] += 1
+            if isinstance(event, dict):
+                op, pid, size = event.get("op"), event.get("pid"), event.get("size")
+            elif isinstance(event, (list, tuple)):
+                op, pid, size = (list(event) + [None, None, None])[:3]
             else:
-                merged.append(block)
-        self.blocks = merged
+                op = pid = size = None
+            if isinstance(pid, int) and not isinstance(pid, bool):
+                pid = str(pid)
+            elif not isinstance(pid, str) or not pid:
+                pid = None
+            if op == "alloc" and pid is not None and isinstance(size, int) and not isinstance(size, bool) and size > 0:
+                if self.try_allocate(pid, size):
+                    summary["allocated"] += 1
+                    continue
+                summary["alloc_failed"] += 1
+            elif op == "free" and pid is not None:
+                if self.try_deallocate(pid):
+                    summary["freed"] += 1
+                    continue
+                summary["free_failed"] += 1
+            else:
+                summary["invalid"] += 1
+            summary["failed"].append(i)
+        return summary
+
+    def columns(self):
+        """Column-oriented JSON form of the memory map, built in one pass over rows()"""
+        starts, sizes, allocated, pid_index = [], [], [], []
+        pids, pid_ids = [], {}  # interned process ids
+        for start, size, used, process_id in self.rows():
+            starts.append(start)
+            sizes.append(size)
+            allocated.append(1 if used else 0)
+            if process_id is None:
+                pid_index.append(-1)
+            else:
+                if process_id not in pid_ids:
+                    pid_ids[process_id] = len(pids)
+                    pids.append(process_id)
+                pid_index.append(pid_ids[process_id])
+        return {"start": starts, "size": sizes, "allocated": allocated, "pid_index": pid_index, "pids": pids}
+
+
+class MemoryManager(Allocator):
+    """Fit-strategy allocator over a BlockTable; blocks are handled as slot numbers"""
+    STRATEGIES = ("first", "next", "best", "worst")
+
+    def __init__(self, total_size, strategy="first", compact_threshold=None):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown allocation strategy: {strategy}")
+        super().__init__()
+        self.total_size = total_size
+        self.free_units = total_size
+        self.strategy = strategy
+        # Auto-compact when a fit fails and external fragmentation >= threshold
+        self.compact_threshold = compact_threshold
+        self.compactions = 0
+        self.bytes_moved = 0
+        self.rover = 0  # next-fit resumes scanning at this address
+        self.blocks = BlockTable()
+        self.head = self.blocks.new(0, total_size)  # initially one free block
+        self.processes = {}                          # process id -> allocated slots
+        self.free_blocks = {0: self.head}            # start address -> free slot
+        self.free_starts = [0]                       # free block starts, address order
+        self.free_sizes = [(total_size, 0)]          # (size, start) of free blocks, size order
+        # First fit: max-size segment tree over the free block starts in
+        # address order. Leaf leaves + start holds that block's size and node
+        # i the largest size below it; stored sparsely (absent = 0), so it
+        # grows with the free list rather than the heap.
+        self.leaves = 1 << max(total_size - 1, 0).bit_length()
+        self.fit_tree = {} if strategy == "first" else None
+        self.set_fit(0, total_size)
+
+    def index_free(self, slot):
+        start, size = self.blocks.start[slot], self.blocks.size[slot]
+        self.free_units += size
+        self.free_blocks[start] = slot
+        insort(self.free_starts, start)
+        insort(self.free_sizes, (size, start))
+        self.set_fit(start, size)
+
+    def unindex_free(self, slot):
+        start, size = self.blocks.start[slot], self.blocks.size[slot]
+        self.free_units -= size
+        del self.free_blocks[start]
+        del self.free_starts[bisect_left(self.free_starts, start)]
+        del self.free_sizes[bisect_left(self.free_sizes, (size, start))]
+        self.set_fit(start, 0)
+
+    def set_fit(self, start, size):
+        """Set the fit-tree leaf for start (0 = no free block) and fix its ancestors"""
+        tree = self.fit_tree
+        if tree is None:
+            return
+        get = tree.get
+        i = self.leaves + start
+        while True:
+            if size:
+                tree[i] = size
+            else:
+                tree.pop(i, None)
+            if i == 1:
+                return
+            sibling = get(i ^ 1, 0)
+            if sibling > size:
+                size = sibling
+            i >>= 1
+            if get(i, 0) == size:
+                return  # ancestors already hold the right maximum
+
+    def first_fit(self, size):
+        """Lowest free block start with at least size units, or None; O(log total_size)"""
+        tree, leaves = self.fit_tree, self.leaves
+        if tree.get(1, 0) < size:
+            return None
+        i = 1
+        while i < leaves:
+            i <<= 1
+            if tree.get(i, 0) < size:
+                i += 1
+        return i - leaves
+
+    def find_free(self, size):
+        """Return the slot of the free block chosen by the strategy, or None"""
+        if self.strategy == "next":
+            # Resume after the last allocation, wrapping around once
+            sizes = self.blocks.size
+            n = len(self.free_starts)
+            i = bisect_left(self.free_starts, self.rover)
+            for k in range(n):
+                start = self.free_starts[(i + k) % n]
+                self.scan_steps += 1
+                if sizes[self.free_blocks[start]] >= size:
+                    return self.free_blocks[start]
+            return None
+        self.scan_steps += 1
+        if self.strategy == "first":
+            start = self.first_fit(size)
+            return None if start is None else self.free_blocks[start]
+        if self.strategy == "best":
+            i = bisect_left(self.free_sizes, (size, -1))
+            if i == len(self.free_sizes):
+                return None
+            return self.free_blocks[self.free_sizes[i][1]]
+        if self.free_sizes and self.free_sizes[-1][0] >= size:
+            return self.free_blocks[self.free_sizes[-1][1]]
+        return None
+
+    def alloc_block(self, process_id, size):
+        """Allocate memory using the configured fit strategy"""
+        slot = self.find_free(size)
+        if slot is None and self.should_compact(size):
+            self.compact_window(*self.plan_compaction(size))
+            slot = self.find_free(size)
+        if slot is None:
+            return False
+        table = self.blocks
+        self.unindex_free(slot)
+        start = table.start[slot]
+        if table.size[slot] > size:
+            # Split: the tail of the hole stays free as a new neighbour
+            nxt = table.next[slot]
+            rest = table.new(start + size, table.size[slot] - size, slot, nxt)
+            if nxt != table.NIL:
+                table.prev[nxt] = rest
+            table.next[slot] = rest
+            table.size[slot] = size
+            self.index_free(rest)
+            self.record(start + size, table.to_dict(rest))
+        table.allocated[slot] = 1
+        table.process_id[slot] = process_id
+        self.rover = start + size
+        self.processes.setdefault(process_id, []).append(slot)
+        self.record(start, table.to_dict(slot))
+        return True
+
+    def free_block(self, process_id):
+        """Free the lowest-addressed block of a process"""
+        slots = self.processes.get(process_id)
+        if not slots:
+            return False
+        slot = min(slots, key=self.blocks.start.__getitem__)
+        slots.remove(slot)
+        if not slots:
+            del self.processes[process_id]
+        self.blocks.allocated[slot] = 0
+        self.blocks.process_id[slot] = None
+        self.merge_free_blocks(slot)
+        return True
+
+    def merge_free_blocks(self, slot):
+        """Merge a freed block with its free address neighbours in O(1) links"""
+        table = self.blocks
+        right = table.next[slot]
+        if right != table.NIL and not table.allocated[right]:
+            self.unindex_free(right)
+            self.record(table.start[right])
+            table.size[slot] += table.size[right]
+            table.unlink(right)
+        left = table.prev[slot]
+        if left != table.NIL and not table.allocated[left]:
+            self.unindex_free(left)
+            self.record(table.start[slot])
+            table.size[left] += table.size[slot]
+            table.unlink(slot)
+            slot = left
+        self.index_free(slot)
+        self.record(table.start[slot], table.to_dict(slot))
+
+    def should_compact(self, size):
+        if self.compact_threshold is None or self.free_units < size:
+            return False
+        return 1 - self.largest_free() / self.free_units >= self.compact_threshold
+
+    def plan_compaction(self, size=None):
+        """Pick the run of free blocks to gather with the fewest bytes moved.
+
+        Sliding the allocated blocks between free blocks a..b down to the
+        start of a leaves one hole holding all of their free space. For a
+        requested size, two pointers find the window with enough free space
+        and the least allocated data inside it; without a size the window
+        spans every free block (full compaction). Returns the slots of the
+        first and last free block of the window, or (None, None) if nothing
+        can be gained.
+        """
+        table = self.blocks
+        frees = []         # free slots in address order
+        moved_before = []  # allocated units before each free block
+        moved = 0
+        slot = self.head
+        while slot != table.NIL:
+            if table.allocated[slot]:
+                moved += table.size[slot]
+            else:
+                frees.append(slot)
+                moved_before.append(moved)
+            slot = table.next[slot]
+        if len(frees) < 2 or (size is not None and self.free_units < size):
+            return None, None
+        if size is None:
+            return frees[0], frees[-1]
+        best = None
+        gathered = 0
+        b = -1
+        for a in range(len(frees)):
+            while gathered < size and b + 1 < len(frees):
+                b += 1
+                gathered += table.size[frees[b]]
+            if gathered < size:
+                break
+            cost = moved_before[b] - moved_before[a]
+            if best is None or cost < best[0]:
+                best = (cost, a, b)
+            gathered -= table.size[frees[a]]
+        return frees[best[1]], frees[best[2]]
+
+    def compact_window(self, first, last):
+        """Slide allocated blocks between free slots first..last down into one hole"""
+        if first is None or first == last:
+            return 0
+        table, nil = self.blocks, BlockTable.NIL
+        left, right = table.prev[first], table.next[last]
+        addr = table.start[first]
+        allocated, hole = [], 0
+        slot = first
+        while slot != right:
+            following = table.next[slot]
+            if table.allocated[slot]:
+                allocated.append((slot, table.start[slot]))
+            else:
+                self.unindex_free(slot)
+                self.record(table.start[slot])
+                hole += table.size[slot]
+                table.release(slot)
+            slot = following
+        prev, moved = left, 0
+        for slot, old_start in allocated:
+            if table.start[slot] != addr:
+                self.record(old_start)
+                table.start[slot] = addr
+                moved += table.size[slot]
+            table.prev[slot] = prev
+            if prev != nil:
+                table.next[prev] = slot
+            prev = slot
+            addr += table.size[slot]
+        free = table.new(addr, hole, prev, right)
+        if prev != nil:
+            table.next[prev] = free
+        if right != nil:
+            table.prev[right] = free
+        if left == nil:
+            self.head = allocated[0][0] if allocated else free
+        self.index_free(free)
+        for slot, old_start in allocated:
+            if table.start[slot] != old_start:
+                self.record(table.start[slot], table.to_dict(slot))
+        self.record(addr, table.to_dict(free))
+        self.compactions += 1
+        self.bytes_moved += moved
+        return moved
+
+    def compact(self):
+        """Fully compact memory; returns the number of units moved"""
+        moved = self.compact_window(*self.plan_compaction())
+        self.version += 1
+        return moved
+
+    def metrics(self):
+        stats = super().metrics()
+        stats["compactions"] = self.compactions
+        stats["bytes_moved"] = self.bytes_moved
+        return stats
+
+    def largest_free(self):
+        return self.free_sizes[-1][0] if self.free_sizes else 0
+
+    def free_count(self):
+        return len(self.free_sizes)
+
+    def rows(self):
+        """Yield (start, size, allocated, process_id) in address order from the columns"""
+        table = self.blocks
+        start, size, allocated, pid, nxt = table.start, table.size, table.allocated, table.process_id, table.next
+        slot = self.head
+        while slot != table.NIL:
+            yield start[slot], size[slot], bool(allocated[slot]), pid[slot]
+            slot = nxt[slot]
 
     def to_list(self):
-        return [b.to_dict() for b in sorted(self.blocks, key=lambda x: x.start)]
+        return [
+            {"start": start, "end": start + size - 1, "size": size,
+             "allocated": allocated, "process_id": process_id}
+            for start, size, allocated, process_id in self.rows()
+        ]
+
+
+class BuddyMemoryManager(Allocator):
+    """Power-of-two buddy allocator with the same surface as MemoryManager"""
+
+    def __init__(self, total_size):
+        super().__init__()
+        self.total_size = total_size
+        self.free_units = total_size
+        self.free_lists = {}  # block size -> set of free block starts
+        self.used = {}        # start address -> (size, process_id, requested)
+        self.processes = {}   # process id -> allocated block starts
+        # Carve the arena into aligned power-of-two roots (500 = 256+128+64+...)
+        start, remaining = 0, total_size
+        while remaining:
+            size = 1 << (remaining.bit_length() - 1)
+            self.free_lists.setdefault(size, set()).add(start)
+            start += size
+            remaining -= size
+        self.max_block = 1 << (total_size.bit_length() - 1) if total_size else 0
+
+    def alloc_block(self, process_id, size):
+        """Allocate the smallest power-of-two block that fits, splitting larger ones"""
+        want = 1 << (size - 1).bit_length()
+        block_size = want
+        self.scan_steps += 1
+        while block_size <= self.max_block and not self.free_lists.get(block_size):
+            block_size <<= 1
+            self.scan_steps += 1
+        if block_size > self.max_block:
+            return False
+        start = min(self.free_lists[block_size])
+        self.free_lists[block_size].remove(start)
+        while block_size > want:
+            block_size >>= 1
+            self.free_lists.setdefault(block_size, set()).add(start + block_size)
+            self.record(start + block_size, self.describe(start + block_size, block_size))
+        self.free_units -= block_size
+        self.used[start] = (block_size, process_id, size)
+        self.record(start, self.describe(start, block_size, process_id, size))
+        self.processes.setdefault(process_id, []).append(start)
+        return True
+
+    def free_block(self, process_id):
+        """Free a process block and merge it with free buddies (start XOR size)"""
+        starts = self.processes.get(process_id)
+        if not starts:
+            return False
+        start = min(starts)
+        starts.remove(start)
+        if not starts:
+            del self.processes[process_id]
+        size = self.used.pop(start)[0]
+        self.free_units += size
+        self.record(start)
+        # Roots are aligned and strictly shrinking, so an equal-sized free
+        # block at start ^ size is always the true buddy, never another root.
+        while (start ^ size) in self.free_lists.get(size, ()):
+            self.free_lists[size].remove(start ^ size)
+            self.record(start ^ size)
+            start &= ~size
+            size <<= 1
+        self.free_lists.setdefault(size, set()).add(start)
+        self.record(start, self.describe(start, size))
+        return True
+
+    def largest_free(self):
+        return max((size for size, starts in self.free_lists.items() if starts), default=0)
+
+    def free_count(self):
+        return sum(len(starts) for starts in self.free_lists.values())
+
+    @staticmethod
+    def describe(start, size, process_id=None, requested=None):
+        block = {"start": start, "end": start + size - 1, "size": size,
+                 "allocated": process_id is not None, "process_id": process_id}
+        if requested is not None:
+            block["requested"] = requested
+        return block
+
+    def to_list(self):
+        blocks = [
+            self.describe(start, size, pid, requested)
+            for start, (size, pid, requested) in self.used.items()
+        ]
+        for size, starts in self.free_lists.items():
+            blocks.extend(self.describe(start, size) for start in starts)
+        return sorted(blocks, key=lambda x: x["start"])
+
+    def rows(self):
+        """Yield (start, size, allocated, process_id) in address order"""
+        rows = [(start, size, True, pid) for start, (size, pid, _) in self.used.items()]
+        for size, starts in self.free_lists.items():
+            rows.extend((start, size, False, None) for start in starts)
+        return iter(sorted(rows))
+
+
+# Create global memory managers, one per allocation strategy
+memories = {
+    "first": MemoryManager(total_size=500),
+    "next": MemoryManager(total_size=500, strategy="next"),
+    "best": MemoryManager(total_size=500, strategy="best"),
+    "worst": MemoryManager(total_size=500, strategy="worst"),
+    "buddy": BuddyMemoryManager(total_size=500),
+}
+memory = memories["first"]
 
 
-# Create global memory manager
-memory = MemoryManager(total_size=500)
+def selected_memory():
+    """Memory manager chosen by the ?strategy= query parameter (default first fit)"""
+    return memories.get(request.args.get('strategy', 'first'))
+
+
+def memory_payload(memory):
+    """Full memory map, or only the blocks changed after ?since=<version>"""
+    since = request.args.get('since', type=int)
+    if since is not None:
+        delta = memory.changes_since(since)
+        if delta is not None:
+            return {"version": memory.version, "delta": delta}
+    return {"version": memory.version, "memory": memory.to_list()}
+
 
 # ------------------------------
 # Flask Routes
@@ -92,9 +641,16 @@ def index():
         </style>
     </head>
     <body>
-        <h2>💾 Dynamic Memory Allocation (First Fit Simulation)</h2>
+        <h2>💾 Dynamic Memory Allocation Simulation</h2>
 
         <div>
+            <select id="strategy" onchange="refresh()">
+                <option value="first">First Fit</option>
+                <option value="next">Next Fit</option>
+                <option value="best">Best Fit</option>
+                <option value="worst">Worst Fit</option>
+                <option value="buddy">Buddy System</option>
+            </select>
             <input type="text" id="pid" placeholder="Process ID">
             <input type="number" id="size" placeholder="Memory Size">
             <button onclick="allocate()">Allocate</button>
@@ -111,23 +667,45 @@ def index():
         <canvas id="canvas" width="1100" height="400"></canvas>
 
         <script>
+            let blocks = new Map();  // start -> block, patched from deltas
+            let version = null;
+
+            function strategy() {
+                return document.getElementById("strategy").value;
+            }
+
+            function since() {
+                return version === null ? "" : `&since=${version}`;
+            }
+
+            function applyUpdate(data) {
+                if (data.delta) {
+                    for (let start of data.delta.removed) blocks.delete(start);
+                    for (let block of data.delta.changed) blocks.set(block.start, block);
+                } else {
+                    blocks = new Map(data.memory.map(b => [b.start, b]));
+                }
+                version = data.version;
+                drawMemory([...blocks.values()].sort((a, b) => a.start - b.start));
+            }
+
             async function allocate() {
                 let pid = document.getElementById("pid").value;
                 let size = parseInt(document.getElementById("size").value);
                 if(!pid || !size) return alert("Enter process ID and size.");
-                let res = await fetch(`/allocate?pid=${pid}&size=${size}`);
+                let res = await fetch(`/allocate?pid=${pid}&size=${size}&strategy=${strategy()}${since()}`);
                 let data = await res.json();
                 document.getElementById("status").innerText = data.message;
-                drawMemory(data.memory);
+                applyUpdate(data);
             }
 
             async function deallocate() {
                 let pid = document.getElementById("pid").value;
                 if(!pid) return alert("Enter process ID to deallocate.");
-                let res = await fetch(`/deallocate?pid=${pid}`);
+                let res = await fetch(`/deallocate?pid=${pid}&strategy=${strategy()}${since()}`);
                 let data = await res.json();
                 document.getElementById("status").innerText = data.message;
-                drawMemory(data.memory);
+                applyUpdate(data);
             }
 
             function drawMemory(blocks) {
@@ -166,12 +744,15 @@ def index():
                 ctx.fillText(`Memory End (${blocks[blocks.length-1].end})`, x - 20, 130);
             }
 
-            // Initialize
-            window.onload = async function() {
-                let res = await fetch('/status');
+            async function refresh() {
+                version = null;
+                let res = await fetch(`/status?strategy=${strategy()}`);
                 let data = await res.json();
-                drawMemory(data.memory);
-            };
+                applyUpdate(data);
+            }
+
+            // Initialize
+            window.onload = refresh;
         </script>
     </body>
     </html>
@@ -179,26 +760,92 @@ def index():
 
 @app.route('/allocate')
 def allocate():
+    memory = selected_memory()
+    if memory is None:
+        return jsonify({"message": "Unknown allocation strategy."}), 400
     pid = request.args.get('pid')
     size = request.args.get('size', type=int)
     if pid and size:
         msg = memory.allocate(pid, size)
     else:
         msg = "Provide process ID and size."
-    return jsonify({"message": msg, "memory": memory.to_list()})
+    return jsonify({"message": msg, **memory_payload(memory)})
 
 @app.route('/deallocate')
 def deallocate():
+    memory = selected_memory()
+    if memory is None:
+        return jsonify({"message": "Unknown allocation strategy."}), 400
     pid = request.args.get('pid')
     if pid:
         msg = memory.deallocate(pid)
     else:
         msg = "Provide process ID to deallocate."
-    return jsonify({"message": msg, "memory": memory.to_list()})
+    return jsonify({"message": msg, **memory_payload(memory)})
 
 @app.route('/status')
 def status():
-    return jsonify({"memory": memory.to_list()})
+    memory = selected_memory()
+    if memory is None:
+        return jsonify({"message": "Unknown allocation strategy."}), 400
+    if request.args.get('format') == 'columns':
+        return jsonify({"columns": memory.columns()})
+    return jsonify(memory_payload(memory))
+
+METRICS = [
+    ("dma_total_units", "gauge", "total_size", "Size of the simulated heap"),
+    ("dma_free_units", "gauge", "free_units", "Free memory units"),
+    ("dma_free_blocks", "gauge", "free_blocks", "Number of free blocks"),
+    ("dma_largest_free_block_units", "gauge", "largest_free_block", "Largest free block"),
+    ("dma_external_fragmentation_ratio", "gauge", "external_fragmentation",
+     "1 - largest free block / free units"),
+    ("dma_alloc_requests_total", "counter", "alloc_requests", "Allocation requests"),
+    ("dma_alloc_failures_total", "counter", "alloc_failures", "Failed allocation requests"),
+    ("dma_alloc_failure_ratio", "gauge", "alloc_failure_rate", "Failed / total allocation requests"),
+    ("dma_frees_total", "counter", "frees", "Successful deallocations"),
+    ("dma_avg_scan_length", "gauge", "avg_scan_length", "Free-list entries examined per allocation"),
+    ("dma_compactions_total", "counter", "compactions", "Compaction passes"),
+    ("dma_compaction_moved_units_total", "counter", "bytes_moved", "Units relocated by compaction"),
+]
+
+
+@app.route('/compact')
+def compact():
+    memory = selected_memory()
+    if memory is None:
+        return jsonify({"message": "Unknown allocation strategy."}), 400
+    if not hasattr(memory, "compact"):
+        return jsonify({"message": "This strategy does not support compaction."}), 400
+    moved = memory.compact()
+    return jsonify({"message": f"Compacted memory, moved {moved} units.", **memory_payload(memory)})
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus text exposition of every strategy's allocator metrics"""
+    stats = {name: m.metrics() for name, m in memories.items()}
+    lines = []
+    for metric, kind, key, help_text in METRICS:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, values in stats.items():
+            if key in values:
+                lines.append(f'{metric}{{strategy="{name}"}} {values[key]}')
+    return "\n".join(lines) + "\n", 200, {"Content-Type": "text/plain; version=0.0.4"}
+
+@app.route('/batch', methods=['POST'])
+def batch():
+    """Apply a JSON trace ([...] or {"events": [...]}) and return summary stats"""
+    memory = selected_memory()
+    if memory is None:
+        return jsonify({"message": "Unknown allocation strategy."}), 400
+    body = request.get_json(silent=True)
+    events = body.get("events") if isinstance(body, dict) else body
+    if not isinstance(events, list):
+        return jsonify({"message": "Provide a JSON list of events."}), 400
+    result = {"summary": memory.apply_trace(events)}
+    if request.args.get('include') == 'memory':
+        result.update(memory_payload(memory))
+    return jsonify(result)
 
 # ------------------------------
 # Run Server
@@ -0,0 +1,148 @@
+import argparse
+import json
+import platform
+import random
+import time
+from collections import deque
+
+from U1DMA import MemoryManager, BuddyMemoryManager
+
+# ------------------------------
+# Benchmark: Dynamic Memory Allocation strategies on synthetic traces
+#
+#   python U1DMAbenchmark.py --events 1000 100000 --output bench.json
+# ------------------------------
+
+STRATEGIES = {
+    "first": lambda heap: MemoryManager(heap, "first"),
+    "next": lambda heap: MemoryManager(heap, "next"),
+    "best": lambda heap: MemoryManager(heap, "best"),
+    "worst": lambda heap: MemoryManager(heap, "worst"),
+    "buddy": lambda heap: BuddyMemoryManager(heap),
+}
+
+SIZES = {
+    "uniform": lambda rng: rng.randint(1, 128),
+    "exponential": lambda rng: max(1, int(rng.expovariate(1 / 32))),
+    "bimodal": lambda rng: rng.randint(1, 16) if rng.random() < 0.8 else rng.randint(256, 1024),
+}
+
+ORDERS = ("lifo", "fifo", "random")
+
+
+def make_trace(events, sizes, order, seed, target_live=1500):
+    """Build a reproducible alloc/free trace in the apply_trace list format.
+
+    Allocations are favoured below target_live live processes and frees
+    above it, so the heap settles into a steady state instead of drifting.
+    """
+    rng = random.Random(seed)
+    size_of = SIZES[sizes]
+    live = deque()
+    trace = []
+    for i in range(events):
+        if not live or rng.random() < (0.75 if len(live) < target_live else 0.25):
+            pid = f"p{i}"
+            live.append(pid)
+            trace.append(("alloc", pid, size_of(rng)))
+        else:
+            if order == "lifo":
+                pid = live.pop()
+            elif order == "fifo":
+                pid = live.popleft()
+            else:
+                j = rng.randrange(len(live))
+                live[j], live[-1] = live[-1], live[j]
+                pid = live.pop()
+            trace.append(("free", pid))
+    return trace
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def run_trace(manager, trace):
+    """Replay a trace event by event, timing each operation.
+
+    Throughput is computed from the summed per-operation latencies, so the
+    block-count and fragmentation sampling between operations (which costs
+    a different amount per engine) does not count against any strategy.
+    """
+    latencies = []
+    live_blocks = peak_blocks = 0
+    fragmentation = 0.0
+    clock = time.perf_counter_ns
+    for event in trace:
+        t0 = clock()
+        if event[0] == "alloc":
+            ok = manager.try_allocate(event[1], event[2])
+            live_blocks += ok
+        else:
+            ok = manager.try_deallocate(event[1])
+            live_blocks -= ok
+        latencies.append(clock() - t0)
+        blocks = live_blocks + manager.free_count()
+        if blocks > peak_blocks:
+            peak_blocks = blocks
+        if manager.free_units:
+            fragmentation += 1 - manager.largest_free() / manager.free_units
+    elapsed = sum(latencies) / 1e9
+    latencies.sort()
+    metrics = manager.metrics()
+    return {
+        "ops_per_sec": len(trace) / elapsed if elapsed else 0.0,
+        "p50_ns": percentile(latencies, 0.50),
+        "p99_ns": percentile(latencies, 0.99),
+        "peak_blocks": peak_blocks,
+        "mean_fragmentation": fragmentation / len(trace) if trace else 0.0,
+        "final_fragmentation": metrics["external_fragmentation"],
+        "alloc_failure_rate": metrics["alloc_failure_rate"],
+        "avg_scan_length": metrics["avg_scan_length"],
+    }
+
+
+def run(strategies, sizes, orders, event_counts, heap, seed, target_live):
+    results = []
+    for events in event_counts:
+        for size_dist in sizes:
+            for order in orders:
+                trace = make_trace(events, size_dist, order, seed, target_live)
+                for name in strategies:
+                    result = {"strategy": name, "sizes": size_dist, "order": order, "events": events}
+                    result.update(run_trace(STRATEGIES[name](heap), trace))
+                    results.append(result)
+    return {
+        "python": platform.python_version(),
+        "heap": heap,
+        "target_live": target_live,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the memory allocation strategies")
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES), default=list(STRATEGIES))
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=list(SIZES))
+    parser.add_argument("--orders", nargs="+", choices=ORDERS, default=list(ORDERS))
+    parser.add_argument("--events", nargs="+", type=int, default=[1000, 10000])
+    parser.add_argument("--heap", type=int, default=1 << 18, help="heap size in units")
+    parser.add_argument("--live", type=int, default=1500, help="steady-state live processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.strategies, args.sizes, args.orders, args.events, args.heap, args.seed, args.live)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,8 @@
-from flask import Flask, request, jsonify, render_template_string
+import json
+from collections import Counter, defaultdict, deque
+from itertools import chain, count, islice
+
+from flask import Flask, Response, request, jsonify, render_template_string
 
 app = Flask(__name__)
 
@@ -7,85 +11,279 @@ app = Flask(__name__)
 # ------------------------------
 
 class Node:
+    __slots__ = ("data", "next", "prev")
+    POOL_LIMIT = 1024
+    pool = []  # released nodes, reused by Node.new to spare the allocator
+
     def __init__(self, data):
         self.data = data
         self.next = None
         self.prev = None
-        self.addr = hex(id(self))  # Simulated memory address
+
+    @property
+    def addr(self):
+        return hex(id(self))  # Simulated memory address, computed only for display
+
+    @classmethod
+    def new(cls, data):
+        """Take a node from the free pool, or allocate one if the pool is empty"""
+        if cls.pool:
+            node = cls.pool.pop()
+            node.data = data
+            return node
+        return cls(data)
+
+    def release(self):
+        """Return an unlinked node to the free pool"""
+        if len(Node.pool) < Node.POOL_LIMIT:
+            self.data = None
+            self.next = None
+            self.prev = None
+            Node.pool.append(self)
 
 
 class DoublyCircularLinkedList:
-    def __init__(self):
+    def __init__(self, indexed=False):
         self.head = None
+        self.length = 0
+        # Optional value -> nodes (deque, in list order) so delete needs no scan
+        self.index = defaultdict(deque) if indexed else None
 
     def insert(self, data):
         """Insert a new node at the end of the circular doubly linked list"""
-        new_node = Node(data)
+        new_node = Node.new(data)
+        self.length += 1
+        if self.index is not None:
+            self.index[data].append(new_node)
         if not self.head:
             self.head = new_node
             new_node.next = new_node
             new_node.prev = new_node
             return f"Inserted {data} as head node (circular doubly linked)"
-        current = self.head
-        while current.next != self.head:
-            current = current.next
-        current.next = new_node
-        new_node.prev = current
+        tail = self.head.prev  # the circular back-link is the tail
+        tail.next = new_node
+        new_node.prev = tail
         new_node.next = self.head
         self.head.prev = new_node
         return f"Inserted node with value {data}"
 
+    def extend(self, values):
+        """Build a chain from values, then splice it in before head in one step"""
+        first = last = None
+        count = 0
+        for data in values:
+            new_node = Node.new(data)
+            if self.index is not None:
+                self.index[data].append(new_node)
+            if last:
+                last.next = new_node
+                new_node.prev = last
+            else:
+                first = new_node
+            last = new_node
+            count += 1
+        if not first:
+            return "No values to insert."
+        self.length += count
+        if not self.head:
+            self.head = first
+        else:
+            tail = self.head.prev
+            tail.next = first
+            first.prev = tail
+        last.next = self.head
+        self.head.prev = last
+        return f"Inserted {count} nodes"
+
     def delete(self, data):
         """Delete a node by value"""
         if not self.head:
             return "List is empty — nothing to delete."
+        if self.index is not None:
+            # O(1) lookup via the value index
+            nodes = self.index.get(data)
+            if not nodes:
+                return f"Node with value {data} not found."
+            current = nodes.popleft()
+            if not nodes:
+                del self.index[data]
+        else:
+            current = self.head
+            while current.data != data:
+                current = current.next
+                if current is self.head:
+                    return f"Node with value {data} not found."
+        if current.next is current:
+            msg = f"Deleted the only node {data} (addr: {current.addr})"
+        elif current is self.head:
+            msg = f"Deleted head node {data} (addr: {current.addr})"
+        else:
+            msg = f"Deleted node with value {data} (addr: {current.addr})"
+        self.unlink(current)
+        return msg
+
+    def unlink(self, current):
+        """Unlink current from the ring and pool it (index bucket already updated)"""
+        if current.next is current:
+            self.head = None
+        else:
+            current.prev.next = current.next
+            current.next.prev = current.prev
+            if current is self.head:
+                self.head = current.next
+        self.length -= 1
+        current.release()
+
+    def delete_many(self, values):
+        """Delete the first occurrence of each value (repeats delete more) in one lap"""
+        wanted = Counter(values)
+        requested = remaining = sum(wanted.values())
         current = self.head
+        last = self.head.prev if self.head else None
+        while current and remaining:
+            nxt = current.next
+            done = current is last
+            if wanted[current.data]:
+                wanted[current.data] -= 1
+                remaining -= 1
+                if self.index is not None:
+                    nodes = self.index[current.data]
+                    nodes.remove(current)
+                    if not nodes:
+                        del self.index[current.data]
+                self.unlink(current)
+            if done:
+                break
+            current = nxt
+        return f"Deleted {requested - remaining} of {requested} values"
 
-        # Case 1: deleting head
-        if current.data == data:
-            if current.next == self.head:
-                deleted_addr = current.addr
-                self.head = None
-                return f"Deleted the only node {data} (addr: {deleted_addr})"
-            else:
-                deleted_addr = current.addr
-                tail = self.head.prev
-                self.head = self.head.next
-                self.head.prev = tail
-                tail.next = self.head
-                return f"Deleted head node {data} (addr: {deleted_addr})"
-
-        # Case 2: deleting non-head
-        current = self.head.next
-        while current != self.head:
-            if current.data == data:
-                current.prev.next = current.next
-                current.next.prev = current.prev
-                return f"Deleted node with value {data} (addr: {current.addr})"
-            current = current.next
-        return f"Node with value {data} not found."
-
-    def to_list(self):
-        """Return structured list with data + address info"""
-        result = []
+    def iter_dicts(self, offset=0):
+        """Yield node dicts once around the ring, starting at position offset"""
         if not self.head:
-            return result
+            return
         current = self.head
+        for _ in range(offset):
+            current = current.next
+            if current is self.head:
+                return
         while True:
-            result.append({
+            yield {
                 "data": current.data,
                 "addr": current.addr,
-                "next": current.next.addr if current.next else None,
-                "prev": current.prev.addr if current.prev else None
-            })
+                "next": current.next.addr,
+                "prev": current.prev.addr
+            }
             current = current.next
-            if current == self.head:
+            if current is self.head:
                 break
-        return result
+
+    def to_list(self, offset=0, limit=None):
+        """Return structured list with data + address info (optionally one window)"""
+        return list(islice(self.iter_dicts(offset), limit))
 
 
 # Create global circular doubly linked list instance
-dll = DoublyCircularLinkedList()
+dll = DoublyCircularLinkedList(indexed=True)
+
+
+def bulk_values():
+    """Values from a JSON array body or a newline-delimited text body.
+
+    Returns None for a JSON body that is not an array (or is not valid JSON).
+    """
+    if request.is_json:
+        body = request.get_json(silent=True)
+        if not isinstance(body, list):
+            return None
+        return [str(value) for value in body]
+    text = request.get_data(as_text=True)
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+READ_ONLY_ENDPOINTS = ('index', 'static', 'status')
+CURSOR_LIMIT = 64
+cursors = {}    # next_cursor token -> (list, mutation count, paused iter_dicts walk)
+mutations = 0   # bumped by every request that may change a list
+cursor_serial = count()
+
+
+@app.before_request
+def count_mutation():
+    """Mark paused cursors stale whenever a request may change a list"""
+    global mutations
+    if request.endpoint not in READ_ONLY_ENDPOINTS:
+        mutations += 1
+
+
+def list_payload(lst):
+    """Whole list, or one ?offset=&limit= window; ?cursor= resumes at next_cursor.
+
+    A window that stops early parks its walk under the returned
+    next_cursor, so fetching the following page continues from there
+    instead of walking offset nodes again. If any list changed in the
+    meantime (or the cursor was evicted) the walk restarts at the offset
+    the token records. Negative offset/limit values are clamped to 0, and
+    an empty window (limit=0) issues no next_cursor.
+    """
+    token = request.args.get('cursor')
+    offset = max(0, request.args.get('offset', default=0, type=int))
+    limit = request.args.get('limit', type=int)
+    if limit is not None:
+        limit = max(0, limit)
+    paused = None
+    if token:
+        paused = cursors.pop(token, None)
+        try:
+            offset = max(0, int(token.partition('.')[0]))
+        except ValueError:
+            pass
+    elif limit is None and not offset:
+        return {"list": lst.to_list()}
+    if paused and paused[0] is lst and paused[1] == mutations:
+        walk = paused[2]
+    else:
+        walk = lst.iter_dicts(offset)
+    page = list(islice(walk, limit))
+    payload = {"offset": offset}
+    if limit:
+        following = next(walk, None)
+        if following is not None:
+            next_cursor = f"{offset + limit}.{next(cursor_serial)}"
+            cursors[next_cursor] = (lst, mutations, chain([following], walk))
+            if len(cursors) > CURSOR_LIMIT:
+                del cursors[next(iter(cursors))]
+            payload["next_cursor"] = next_cursor
+    payload["list"] = page
+    return payload
+
+
+def stream_list(lst, chunk=1000):
+    """Chunked JSON body for {"list": [...]} built while walking the list.
+
+    A request that may change a list while the body is being sent stops
+    the stream at the next chunk boundary: the unsent batch is dropped
+    (its nodes may already be back in the pool) and the body is closed
+    with an "error" field instead.
+    """
+    def generate():
+        stamp = mutations
+        yield '{"list": ['
+        sep = ''
+        batch = []
+        for node in lst.iter_dicts():
+            batch.append(json.dumps(node))
+            if len(batch) == chunk:
+                if mutations != stamp:
+                    break
+                yield sep + ','.join(batch)
+                sep, batch = ',', []
+        if mutations != stamp:
+            yield '], "error": "List changed while streaming; response is incomplete."}'
+            return
+        if batch:
+            yield sep + ','.join(batch)
+        yield ']}'
+    return Response(generate(), mimetype='application/json')
 
 # ------------------------------
 # Flask Routes
@@ -241,7 +439,7 @@ def insert_node():
         msg = dll.insert(value)
     else:
         msg = "No value provided."
-    return jsonify({"message": msg, "list": dll.to_list()})
+    return jsonify({"message": msg, **list_payload(dll)})
 
 @app.route('/delete')
 def delete_node():
@@ -250,7 +448,29 @@ def delete_node():
         msg = dll.delete(value)
     else:
         msg = "No value provided for deletion."
-    return jsonify({"message": msg, "list": dll.to_list()})
+    return jsonify({"message": msg, **list_payload(dll)})
+
+@app.route('/bulk_insert', methods=['POST'])
+def bulk_insert():
+    values = bulk_values()
+    if values is None:
+        return jsonify({"message": "Body must be a JSON array or newline-delimited text."}), 400
+    msg = dll.extend(values)
+    return jsonify({"message": msg, "length": dll.length})
+
+@app.route('/bulk_delete', methods=['POST'])
+def bulk_delete():
+    values = bulk_values()
+    if values is None:
+        return jsonify({"message": "Body must be a JSON array or newline-delimited text."}), 400
+    msg = dll.delete_many(values)
+    return jsonify({"message": msg, "length": dll.length})
+
+@app.route('/status')
+def status():
+    if request.args.get('stream'):
+        return stream_list(dll)
+    return jsonify(list_payload(dll))
 
 # ------------------------------
 # Run Server
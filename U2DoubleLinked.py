@@ -1,4 +1,9 @@
-from flask import Flask, request, jsonify, render_template_string
+import json
+from array import array
+from collections import Counter, defaultdict, deque
+from itertools import chain, count, islice
+
+from flask import Flask, Response, request, jsonify, render_template_string
 
 app = Flask(__name__)
 
@@ -7,19 +12,49 @@ app = Flask(__name__)
 # ------------------------------
 
 class Node:
+    __slots__ = ("data", "prev", "next")
+    POOL_LIMIT = 1024
+    pool = []  # released nodes, reused by Node.new to spare the allocator
+
     def __init__(self, data):
         self.data = data
         self.prev = None
         self.next = None
-        self.addr = hex(id(self))  # Simulated memory address
+
+    @property
+    def addr(self):
+        return hex(id(self))  # Simulated memory address, computed only for display
+
+    @classmethod
+    def new(cls, data):
+        """Take a node from the free pool, or allocate one if the pool is empty"""
+        if cls.pool:
+            node = cls.pool.pop()
+            node.data = data
+            return node
+        return cls(data)
+
+    def release(self):
+        """Return an unlinked node to the free pool"""
+        if len(Node.pool) < Node.POOL_LIMIT:
+            self.data = None
+            self.prev = None
+            self.next = None
+            Node.pool.append(self)
 
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, indexed=False):
         self.head = None
+        self.length = 0
+        # Optional value -> nodes (deque, in list order) so delete needs no scan
+        self.index = defaultdict(deque) if indexed else None
 
     def insert(self, data):
         """Insert a new node at the end"""
-        new_node = Node(data)
+        new_node = Node.new(data)
+        self.length += 1
+        if self.index is not None:
+            self.index[data].append(new_node)
         if not self.head:
             self.head = new_node
             return f"Inserted {data} as head node"
@@ -34,36 +69,538 @@ class DoublyLinkedList:
         """Delete the first node with given data"""
         if not self.head:
             return "List is empty — nothing to delete."
-        current = self.head
-        while current and current.data != data:
-            current = current.next
-        if not current:
-            return f"Node with value {data} not found."
+        if self.index is not None:
+            nodes = self.index.get(data)
+            if not nodes:
+                return f"Node with value {data} not found."
+            current = nodes.popleft()
+            if not nodes:
+                del self.index[data]
+        else:
+            current = self.head
+            while current and current.data != data:
+                current = current.next
+            if not current:
+                return f"Node with value {data} not found."
+        msg = f"Deleted node with value {data} (addr: {current.addr})"
+        self.unlink(current)
+        return msg
+
+    def unlink(self, current):
+        """Unlink current and pool it (index bucket already updated)"""
         if current.prev:
             current.prev.next = current.next
         else:
             self.head = current.next
         if current.next:
             current.next.prev = current.prev
-        return f"Deleted node with value {data} (addr: {current.addr})"
-
-    def to_list(self):
-        """Return structured list with data + address info"""
-        result = []
+        self.length -= 1
+        current.release()
+
+    def extend(self, values):
+        """Walk to the tail once, then append every value after it"""
+        tail = self.head
+        while tail and tail.next:
+            tail = tail.next
+        count = 0
+        for data in values:
+            new_node = Node.new(data)
+            if self.index is not None:
+                self.index[data].append(new_node)
+            if tail:
+                tail.next = new_node
+                new_node.prev = tail
+            else:
+                self.head = new_node
+            tail = new_node
+            count += 1
+        self.length += count
+        if not count:
+            return "No values to insert."
+        return f"Inserted {count} nodes"
+
+    def delete_many(self, values):
+        """Delete the first occurrence of each value (repeats delete more) in one pass"""
+        wanted = Counter(values)
+        requested = remaining = sum(wanted.values())
         current = self.head
+        while current and remaining:
+            nxt = current.next
+            if wanted[current.data]:
+                wanted[current.data] -= 1
+                remaining -= 1
+                if self.index is not None:
+                    nodes = self.index[current.data]
+                    nodes.remove(current)
+                    if not nodes:
+                        del self.index[current.data]
+                self.unlink(current)
+            current = nxt
+        return f"Deleted {requested - remaining} of {requested} values"
+
+    def iter_dicts(self, offset=0):
+        """Yield node dicts in list order, starting at position offset"""
+        current = self.head
+        for _ in range(offset):
+            if not current:
+                return
+            current = current.next
         while current:
-            result.append({
+            yield {
                 "data": current.data,
                 "addr": current.addr,
                 "prev": current.prev.addr if current.prev else None,
                 "next": current.next.addr if current.next else None
-            })
+            }
             current = current.next
+
+    def to_list(self, offset=0, limit=None):
+        """Return structured list with data + address info (optionally one window)"""
+        return list(islice(self.iter_dicts(offset), limit))
+
+
+class CursorDoublyLinkedList:
+    """Doubly linked list stored in parallel arrays, linked by slot numbers.
+
+    next/prev are array('l') columns of slot indexes (NIL = -1) and data is a
+    plain list, so a node costs two machine words plus its value. Deleted
+    slots are chained through next into a free list and reused by insert.
+    Same insert/delete/to_list API as DoublyLinkedList; addr is the slot.
+    """
+    NIL = -1
+
+    def __init__(self, indexed=False):
+        self.data = []
+        self.next = array('l')
+        self.prev = array('l')
+        self.head = self.tail = self.NIL
+        self.free = self.NIL  # first free slot, chained through next
+        self.length = 0
+        # Optional value -> slots (deque, in list order) so delete needs no scan
+        self.index = defaultdict(deque) if indexed else None
+
+    def new_slot(self, data):
+        slot = self.free
+        if slot == self.NIL:
+            slot = len(self.data)
+            self.data.append(data)
+            self.next.append(self.NIL)
+            self.prev.append(self.NIL)
+        else:
+            self.free = self.next[slot]
+            self.data[slot] = data
+            self.next[slot] = self.NIL
+        return slot
+
+    def insert(self, data):
+        """Insert a new node at the end (O(1) via tail)"""
+        slot = self.new_slot(data)
+        self.length += 1
+        if self.index is not None:
+            self.index[data].append(slot)
+        self.prev[slot] = self.tail
+        if self.tail == self.NIL:
+            self.head = self.tail = slot
+            return f"Inserted {data} as head node"
+        self.next[self.tail] = slot
+        self.tail = slot
+        return f"Inserted node with value {data}"
+
+    def delete(self, data):
+        """Delete the first node with given data"""
+        if self.head == self.NIL:
+            return "List is empty — nothing to delete."
+        if self.index is not None:
+            slots = self.index.get(data)
+            if not slots:
+                return f"Node with value {data} not found."
+            slot = slots.popleft()
+            if not slots:
+                del self.index[data]
+        else:
+            slot = self.head
+            while slot != self.NIL and self.data[slot] != data:
+                slot = self.next[slot]
+            if slot == self.NIL:
+                return f"Node with value {data} not found."
+        self.unlink(slot)
+        return f"Deleted node with value {data} (addr: {self.addr(slot)})"
+
+    def unlink(self, slot):
+        """Unlink slot and chain it onto the free list (index bucket already updated)"""
+        prev, nxt = self.prev[slot], self.next[slot]
+        if prev != self.NIL:
+            self.next[prev] = nxt
+        else:
+            self.head = nxt
+        if nxt != self.NIL:
+            self.prev[nxt] = prev
+        else:
+            self.tail = prev
+        self.data[slot] = None
+        self.next[slot] = self.free
+        self.free = slot
+        self.length -= 1
+
+    def extend(self, values):
+        """Append every value after the tail"""
+        count = 0
+        for data in values:
+            slot = self.new_slot(data)
+            if self.index is not None:
+                self.index[data].append(slot)
+            self.prev[slot] = self.tail
+            if self.tail == self.NIL:
+                self.head = slot
+            else:
+                self.next[self.tail] = slot
+            self.tail = slot
+            count += 1
+        self.length += count
+        if not count:
+            return "No values to insert."
+        return f"Inserted {count} nodes"
+
+    def delete_many(self, values):
+        """Delete the first occurrence of each value (repeats delete more) in one pass"""
+        wanted = Counter(values)
+        requested = remaining = sum(wanted.values())
+        slot = self.head
+        while slot != self.NIL and remaining:
+            nxt = self.next[slot]
+            data = self.data[slot]
+            if wanted[data]:
+                wanted[data] -= 1
+                remaining -= 1
+                if self.index is not None:
+                    slots = self.index[data]
+                    slots.remove(slot)
+                    if not slots:
+                        del self.index[data]
+                self.unlink(slot)
+            slot = nxt
+        return f"Deleted {requested - remaining} of {requested} values"
+
+    @staticmethod
+    def addr(slot):
+        return f"[{slot}]"  # Slot number stands in for the memory address
+
+    def iter_dicts(self, offset=0):
+        """Yield node dicts in list order, starting at position offset"""
+        data, nxt, prv, addr, nil = self.data, self.next, self.prev, self.addr, self.NIL
+        slot = self.head
+        for _ in range(offset):
+            if slot == nil:
+                return
+            slot = nxt[slot]
+        while slot != nil:
+            yield {
+                "data": data[slot],
+                "addr": addr(slot),
+                "prev": addr(prv[slot]) if prv[slot] != nil else None,
+                "next": addr(nxt[slot]) if nxt[slot] != nil else None
+            }
+            slot = nxt[slot]
+
+    def to_list(self, offset=0, limit=None):
+        """Return structured list with data + slot info (optionally one window)"""
+        return list(islice(self.iter_dicts(offset), limit))
+
+
+class Chunk:
+    __slots__ = ("values", "prev", "next")
+
+    def __init__(self):
+        self.values = []
+        self.prev = None
+        self.next = None
+
+    @property
+    def addr(self):
+        return hex(id(self))  # Simulated memory address, computed only for display
+
+    def slot(self, i):
+        return f"{self.addr}[{i}]"  # Address of the i-th value: chunk plus position
+
+
+class UnrolledDoublyLinkedList:
+    """Doubly linked list of chunks holding up to CAPACITY values each.
+
+    Appends fill the tail chunk; deletes merge a chunk that drops below half
+    full with its successor (or borrow from it), so traversal touches one
+    Python object per CAPACITY values. to_list has the same per-value shape
+    as DoublyLinkedList, with each value's slot as addr and an extra chunk
+    field naming the chunk that holds it; windows count values.
+    """
+    CAPACITY = 16
+    SLOT_SUFFIXES = [f"{i}]" for i in range(CAPACITY)]  # "[i]" tails of slot addresses
+
+    def __init__(self):
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    def insert(self, data):
+        """Append to the tail chunk, starting a new chunk when it is full"""
+        self.length += 1
+        if self.tail and len(self.tail.values) < self.CAPACITY:
+            self.tail.values.append(data)
+            return f"Inserted node with value {data}"
+        chunk = Chunk()
+        chunk.values.append(data)
+        chunk.prev = self.tail
+        if self.tail:
+            self.tail.next = chunk
+            self.tail = chunk
+            return f"Inserted node with value {data}"
+        self.head = self.tail = chunk
+        return f"Inserted {data} as head node"
+
+    def unlink(self, chunk):
+        if chunk.prev:
+            chunk.prev.next = chunk.next
+        else:
+            self.head = chunk.next
+        if chunk.next:
+            chunk.next.prev = chunk.prev
+        else:
+            self.tail = chunk.prev
+
+    def delete(self, data):
+        """Delete the first occurrence of data, rebalancing its chunk"""
+        if not self.head:
+            return "List is empty — nothing to delete."
+        chunk = self.head
+        while chunk and data not in chunk.values:
+            chunk = chunk.next
+        if not chunk:
+            return f"Node with value {data} not found."
+        i = chunk.values.index(data)
+        msg = f"Deleted node with value {data} (addr: {chunk.slot(i)})"
+        del chunk.values[i]
+        self.length -= 1
+        nxt = chunk.next
+        if not chunk.values:
+            self.unlink(chunk)
+        elif len(chunk.values) < self.CAPACITY // 2 and nxt:
+            if len(chunk.values) + len(nxt.values) <= self.CAPACITY:
+                # Merge the successor into this chunk
+                chunk.values.extend(nxt.values)
+                self.unlink(nxt)
+            else:
+                # Borrow from the successor until both are at least half full
+                take = self.CAPACITY // 2 - len(chunk.values)
+                chunk.values.extend(nxt.values[:take])
+                del nxt.values[:take]
+        return msg
+
+    def extend(self, values):
+        """Top up the tail chunk, then append full chunks of CAPACITY values"""
+        values = list(values)
+        if not values:
+            return "No values to insert."
+        self.length += len(values)
+        start = 0
+        if self.tail:
+            start = self.CAPACITY - len(self.tail.values)
+            self.tail.values.extend(values[:start])
+        for i in range(start, len(values), self.CAPACITY):
+            chunk = Chunk()
+            chunk.values = values[i:i + self.CAPACITY]
+            chunk.prev = self.tail
+            if self.tail:
+                self.tail.next = chunk
+            else:
+                self.head = chunk
+            self.tail = chunk
+        return f"Inserted {len(values)} nodes"
+
+    def delete_many(self, values):
+        """Delete the first occurrence of each value (repeats delete more), then
+        repack the chunks in a second linear pass"""
+        wanted = Counter(values)
+        requested = remaining = sum(wanted.values())
+        chunk = self.head
+        while chunk and remaining:
+            kept = []
+            for data in chunk.values:
+                if wanted[data]:
+                    wanted[data] -= 1
+                    remaining -= 1
+                else:
+                    kept.append(data)
+            chunk.values = kept
+            chunk = chunk.next
+        self.length -= requested - remaining
+        self.repack()
+        return f"Deleted {requested - remaining} of {requested} values"
+
+    def repack(self):
+        """Drop empty chunks and top up any chunk below half full from its successor"""
+        chunk = self.head
+        while chunk:
+            nxt = chunk.next
+            if not chunk.values:
+                self.unlink(chunk)
+            else:
+                while nxt and len(chunk.values) < self.CAPACITY // 2:
+                    take = self.CAPACITY - len(chunk.values)
+                    chunk.values.extend(nxt.values[:take])
+                    del nxt.values[:take]
+                    if nxt.values:
+                        break
+                    self.unlink(nxt)
+                    nxt = chunk.next
+            chunk = nxt
+
+    def iter_dicts(self, offset=0):
+        """Yield one dict per value in list order, starting at value position offset"""
+        chunk = self.head
+        while chunk and offset >= len(chunk.values):
+            offset -= len(chunk.values)  # skip whole chunks without touching their values
+            chunk = chunk.next
+        i = offset
+        # Slot strings are built once per chunk from its addr prefix; each
+        # value's prev/next reuse its neighbours' strings
+        tail = chunk.prev.slot(len(chunk.prev.values) - 1) if chunk and chunk.prev else None
+        while chunk:
+            values, addr = chunk.values, chunk.addr
+            prefix = addr + "["
+            slots = [prefix + suffix for suffix in self.SLOT_SUFFIXES[:len(values)]]
+            prevs = [tail] + slots
+            slots.append(chunk.next.slot(0) if chunk.next else None)
+            for data, here, prev, nxt in zip(values[i:], slots[i:], prevs[i:], slots[i + 1:]):
+                yield {"data": data, "addr": here, "prev": prev, "next": nxt, "chunk": addr}
+            if values:
+                tail = slots[-2]
+            chunk, i = chunk.next, 0
+
+    def to_list(self, offset=0, limit=None):
+        """Return structured list with data + slot info (optionally one window)"""
+        return list(islice(self.iter_dicts(offset), limit))
+
+    def values(self):
+        """All values in order, flattened from the chunks"""
+        result = []
+        chunk = self.head
+        while chunk:
+            result.extend(chunk.values)
+            chunk = chunk.next
         return result
 
 
-# Create global doubly linked list instance
-dll = DoublyLinkedList()
+# Create global doubly linked list instances, one per storage backend
+lists = {
+    "nodes": DoublyLinkedList(indexed=True),
+    "cursor": CursorDoublyLinkedList(indexed=True),
+    "unrolled": UnrolledDoublyLinkedList(),
+}
+dll = lists["nodes"]
+
+
+def selected_list():
+    """List chosen by the ?backend= query parameter (default pointer nodes)"""
+    return lists.get(request.args.get('backend', 'nodes'))
+
+
+def bulk_values():
+    """Values from a JSON array body or a newline-delimited text body.
+
+    Returns None for a JSON body that is not an array (or is not valid JSON).
+    """
+    if request.is_json:
+        body = request.get_json(silent=True)
+        if not isinstance(body, list):
+            return None
+        return [str(value) for value in body]
+    text = request.get_data(as_text=True)
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+READ_ONLY_ENDPOINTS = ('index', 'static', 'status')
+CURSOR_LIMIT = 64
+cursors = {}    # next_cursor token -> (list, mutation count, paused iter_dicts walk)
+mutations = 0   # bumped by every request that may change a list
+cursor_serial = count()
+
+
+@app.before_request
+def count_mutation():
+    """Mark paused cursors stale whenever a request may change a list"""
+    global mutations
+    if request.endpoint not in READ_ONLY_ENDPOINTS:
+        mutations += 1
+
+
+def list_payload(lst):
+    """Whole list, or one ?offset=&limit= window; ?cursor= resumes at next_cursor.
+
+    A window that stops early parks its walk under the returned
+    next_cursor, so fetching the following page continues from there
+    instead of walking offset nodes again. If any list changed in the
+    meantime (or the cursor was evicted) the walk restarts at the offset
+    the token records. Negative offset/limit values are clamped to 0, and
+    an empty window (limit=0) issues no next_cursor.
+    """
+    token = request.args.get('cursor')
+    offset = max(0, request.args.get('offset', default=0, type=int))
+    limit = request.args.get('limit', type=int)
+    if limit is not None:
+        limit = max(0, limit)
+    paused = None
+    if token:
+        paused = cursors.pop(token, None)
+        try:
+            offset = max(0, int(token.partition('.')[0]))
+        except ValueError:
+            pass
+    elif limit is None and not offset:
+        return {"list": lst.to_list()}
+    if paused and paused[0] is lst and paused[1] == mutations:
+        walk = paused[2]
+    else:
+        walk = lst.iter_dicts(offset)
+    page = list(islice(walk, limit))
+    payload = {"offset": offset}
+    if limit:
+        following = next(walk, None)
+        if following is not None:
+            next_cursor = f"{offset + limit}.{next(cursor_serial)}"
+            cursors[next_cursor] = (lst, mutations, chain([following], walk))
+            if len(cursors) > CURSOR_LIMIT:
+                del cursors[next(iter(cursors))]
+            payload["next_cursor"] = next_cursor
+    payload["list"] = page
+    return payload
+
+
+def stream_list(lst, chunk=1000):
+    """Chunked JSON body for {"list": [...]} built while walking the list.
+
+    A request that may change a list while the body is being sent stops
+    the stream at the next chunk boundary: the unsent batch is dropped
+    (its nodes may already be back in the pool) and the body is closed
+    with an "error" field instead.
+    """
+    def generate():
+        stamp = mutations
+        yield '{"list": ['
+        sep = ''
+        batch = []
+        for node in lst.iter_dicts():
+            batch.append(json.dumps(node))
+            if len(batch) == chunk:
+                if mutations != stamp:
+                    break
+                yield sep + ','.join(batch)
+                sep, batch = ',', []
+        if mutations != stamp:
+            yield '], "error": "List changed while streaming; response is incomplete."}'
+            return
+        if batch:
+            yield sep + ','.join(batch)
+        yield ']}'
+    return Response(generate(), mimetype='application/json')
 
 # ------------------------------
 # Flask Routes
@@ -87,6 +624,11 @@ def index():
         <h2>🔗 Doubly Linked List Visualization (Data on Top, Address Below)</h2>
 
         <div>
+            <select id="backend" onchange="refresh()">
+                <option value="nodes">Pointer Nodes</option>
+                <option value="cursor">Cursor Arrays</option>
+                <option value="unrolled">Unrolled Chunks</option>
+            </select>
             <input type="text" id="nodeValue" placeholder="Enter node value">
             <button onclick="insertNode()">Insert Node</button>
             <button onclick="deleteNode()">Delete Node</button>
@@ -96,10 +638,20 @@ def index():
         <canvas id="canvas" width="1600" height="500"></canvas>
 
         <script>
+            function backend() {
+                return '&backend=' + document.getElementById("backend").value;
+            }
+
+            async function refresh() {
+                let res = await fetch('/status?' + backend());
+                let data = await res.json();
+                drawList(data.list);
+            }
+
             async function insertNode() {
                 let val = document.getElementById("nodeValue").value;
                 if(!val) return alert("Enter a value");
-                let res = await fetch('/insert?value=' + val);
+                let res = await fetch('/insert?value=' + val + backend());
                 let data = await res.json();
                 document.getElementById("status").innerText = data.message;
                 drawList(data.list);
@@ -108,7 +660,7 @@ def index():
             async function deleteNode() {
                 let val = document.getElementById("nodeValue").value;
                 if(!val) return alert("Enter a value to delete");
-                let res = await fetch('/delete?value=' + val);
+                let res = await fetch('/delete?value=' + val + backend());
                 let data = await res.json();
                 document.getElementById("status").innerText = data.message;
                 drawList(data.list);
@@ -215,22 +767,62 @@ def index():
 
 @app.route('/insert')
 def insert_node():
+    dll = selected_list()
+    if dll is None:
+        return jsonify({"message": "Unknown list backend."}), 400
     value = request.args.get('value')
     if value:
         msg = dll.insert(value)
     else:
         msg = "No value provided."
-    return jsonify({"message": msg, "list": dll.to_list()})
+    return jsonify({"message": msg, **list_payload(dll)})
 
 
 @app.route('/delete')
 def delete_node():
+    dll = selected_list()
+    if dll is None:
+        return jsonify({"message": "Unknown list backend."}), 400
     value = request.args.get('value')
     if value:
         msg = dll.delete(value)
     else:
         msg = "No value provided for deletion."
-    return jsonify({"message": msg, "list": dll.to_list()})
+    return jsonify({"message": msg, **list_payload(dll)})
+
+
+@app.route('/bulk_insert', methods=['POST'])
+def bulk_insert():
+    dll = selected_list()
+    if dll is None:
+        return jsonify({"message": "Unknown list backend."}), 400
+    values = bulk_values()
+    if values is None:
+        return jsonify({"message": "Body must be a JSON array or newline-delimited text."}), 400
+    msg = dll.extend(values)
+    return jsonify({"message": msg, "length": dll.length})
+
+
+@app.route('/bulk_delete', methods=['POST'])
+def bulk_delete():
+    dll = selected_list()
+    if dll is None:
+        return jsonify({"message": "Unknown list backend."}), 400
+    values = bulk_values()
+    if values is None:
+        return jsonify({"message": "Body must be a JSON array or newline-delimited text."}), 400
+    msg = dll.delete_many(values)
+    return jsonify({"message": msg, "length": dll.length})
+
+
+@app.route('/status')
+def status():
+    dll = selected_list()
+    if dll is None:
+        return jsonify({"message": "Unknown list backend."}), 400
+    if request.args.get('stream'):
+        return stream_list(dll)
+    return jsonify(list_payload(dll))
 
 
 # ------------------------------
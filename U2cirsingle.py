@@ -1,4 +1,8 @@
-from flask import Flask, request, jsonify, render_template_string
+import json
+from collections import Counter, defaultdict, deque
+from itertools import chain, count, islice
+
+from flask import Flask, Response, request, jsonify, render_template_string
 
 app = Flask(__name__)
 
@@ -7,84 +11,303 @@ app = Flask(__name__)
 # ------------------------------
 
 class Node:
+    __slots__ = ("data", "next")
+    POOL_LIMIT = 1024
+    pool = []  # released nodes, reused by Node.new to spare the allocator
+
     def __init__(self, data):
         self.data = data
         self.next = None
-        self.addr = hex(id(self))  # Simulated memory address
+
+    @property
+    def addr(self):
+        return hex(id(self))  # Simulated memory address, computed only for display
+
+    @classmethod
+    def new(cls, data):
+        """Take a node from the free pool, or allocate one if the pool is empty"""
+        if cls.pool:
+            node = cls.pool.pop()
+            node.data = data
+            return node
+        return cls(data)
+
+    def release(self):
+        """Return an unlinked node to the free pool"""
+        if len(Node.pool) < Node.POOL_LIMIT:
+            self.data = None
+            self.next = None
+            Node.pool.append(self)
 
 
 class CircularLinkedList:
-    def __init__(self):
-        self.head = None
+    def __init__(self, indexed=False):
+        self.tail = None  # head is always tail.next
+        self.length = 0
+        # Optional value -> nodes (deque, in list order) and node -> predecessor
+        # maps, so delete can find and unlink a node without walking the ring
+        self.index = defaultdict(deque) if indexed else None
+        self.pred = {} if indexed else None
+
+    @property
+    def head(self):
+        return self.tail.next if self.tail else None
+
+    def link(self, new_node):
+        """Link new_node between tail and head; the caller decides which end it is"""
+        self.length += 1
+        if not self.tail:
+            new_node.next = new_node  # Point to itself
+            self.tail = new_node
+            if self.pred is not None:
+                self.pred[new_node] = new_node
+            return True
+        head = self.tail.next
+        new_node.next = head
+        self.tail.next = new_node
+        if self.pred is not None:
+            self.pred[new_node] = self.tail
+            self.pred[head] = new_node
+        return False
 
     def insert(self, data):
-        """Insert a new node at the end of the circular linked list"""
-        new_node = Node(data)
-        if not self.head:
-            self.head = new_node
-            new_node.next = new_node  # Point to itself
+        """Insert a new node at the end of the circular linked list (O(1) via tail)"""
+        new_node = Node.new(data)
+        if self.index is not None:
+            self.index[data].append(new_node)
+        if self.link(new_node):
             return f"Inserted {data} as head node (circular link to itself)"
-        current = self.head
-        while current.next != self.head:
-            current = current.next
-        current.next = new_node
-        new_node.next = self.head
+        self.tail = new_node
         return f"Inserted node with value {data}"
 
+    def prepend(self, data):
+        """Insert a new node before the head (O(1): tail.next becomes the new node)"""
+        new_node = Node.new(data)
+        if self.index is not None:
+            self.index[data].appendleft(new_node)
+        if self.link(new_node):
+            return f"Inserted {data} as head node (circular link to itself)"
+        return f"Inserted {data} as head node"
+
     def delete(self, data):
         """Delete the first node with given data"""
-        if not self.head:
+        if not self.tail:
             return "List is empty — nothing to delete."
+        if self.index is not None:
+            nodes = self.index.get(data)
+            if not nodes:
+                return f"Node with value {data} not found."
+            current = nodes.popleft()
+            if not nodes:
+                del self.index[data]
+            prev = self.pred[current]
+        else:
+            # The tail is the head's predecessor, so no case needs a second walk
+            prev, current = self.tail, self.tail.next
+            while current.data != data:
+                if current is self.tail:
+                    return f"Node with value {data} not found."
+                prev, current = current, current.next
+        if current.next is current:
+            msg = f"Deleted the only node {data} (addr: {current.addr})"
+        elif current is self.tail.next:
+            msg = f"Deleted head node {data} (addr: {current.addr})"
+        else:
+            msg = f"Deleted node with value {data} (addr: {current.addr})"
+        self.unlink(current, prev)
+        return msg
+
+    def unlink(self, current, prev):
+        """Unlink current given its predecessor and pool it (index bucket already updated)"""
+        self.length -= 1
+        if self.pred is not None:
+            del self.pred[current]
+        if current.next is current:
+            self.tail = None
+        else:
+            prev.next = current.next
+            if self.pred is not None:
+                self.pred[current.next] = prev
+            if current is self.tail:
+                self.tail = prev
+        current.release()
+
+    def extend(self, values):
+        """Append every value after the tail in one pass"""
+        count = 0
+        for data in values:
+            new_node = Node.new(data)
+            if self.index is not None:
+                self.index[data].append(new_node)
+            self.link(new_node)
+            self.tail = new_node
+            count += 1
+        if not count:
+            return "No values to insert."
+        return f"Inserted {count} nodes"
+
+    def delete_many(self, values):
+        """Delete the first occurrence of each value (repeats delete more) in one lap"""
+        wanted = Counter(values)
+        requested = remaining = sum(wanted.values())
+        if self.tail:
+            prev, current = self.tail, self.tail.next
+            for _ in range(self.length):
+                if not remaining:
+                    break
+                nxt = current.next
+                if wanted[current.data]:
+                    wanted[current.data] -= 1
+                    remaining -= 1
+                    if self.index is not None:
+                        nodes = self.index[current.data]
+                        nodes.remove(current)
+                        if not nodes:
+                            del self.index[current.data]
+                    self.unlink(current, prev)
+                else:
+                    prev = current
+                current = nxt
+        return f"Deleted {requested - remaining} of {requested} values"
+
+    def rotate(self, k):
+        """Advance the head k nodes along the ring without relinking any node.
+
+        With the value index enabled, each node that passes from the front
+        to the back also moves from the front to the back of its value
+        bucket, so buckets stay in ring order and delete keeps removing the
+        first match from the new head.
+        """
+        if not self.tail:
+            return "List is empty — nothing to rotate."
+        for _ in range(k % self.length):
+            self.tail = self.tail.next
+            if self.index is not None:
+                self.index[self.tail.data].rotate(-1)
+        return f"Rotated list by {k} (head is now {self.head.data})"
+
+    def iter_dicts(self, offset=0):
+        """Yield node dicts once around the ring, starting at position offset"""
+        if not self.tail or offset >= self.length:
+            return
         current = self.head
-        prev = None
-
-        # Case 1: deleting head
-        if current.data == data:
-            # If only one node in the list
-            if current.next == self.head:
-                deleted_addr = current.addr
-                self.head = None
-                return f"Deleted the only node {data} (addr: {deleted_addr})"
-            else:
-                # Find last node to update its next pointer
-                while current.next != self.head:
-                    current = current.next
-                deleted_addr = self.head.addr
-                current.next = self.head.next
-                self.head = self.head.next
-                return f"Deleted head node {data} (addr: {deleted_addr})"
-
-        # Case 2: deleting non-head node
-        prev = self.head
-        current = self.head.next
-        while current != self.head:
-            if current.data == data:
-                prev.next = current.next
-                return f"Deleted node with value {data} (addr: {current.addr})"
-            prev = current
+        for _ in range(offset):
             current = current.next
-        return f"Node with value {data} not found."
-
-    def to_list(self):
-        """Return structured list with data + address info"""
-        result = []
-        if not self.head:
-            return result
-        current = self.head
-        while True:
-            result.append({
+        for _ in range(self.length - offset):
+            yield {
                 "data": current.data,
                 "addr": current.addr,
-                "next": current.next.addr if current.next else None
-            })
+                "next": current.next.addr
+            }
             current = current.next
-            if current == self.head:
-                break
-        return result
+
+    def to_list(self, offset=0, limit=None):
+        """Return structured list with data + address info (optionally one window)"""
+        return list(islice(self.iter_dicts(offset), limit))
 
 
 # Create global circular linked list instance
-circular_list = CircularLinkedList()
+circular_list = CircularLinkedList(indexed=True)
+
+
+def bulk_values():
+    """Values from a JSON array body or a newline-delimited text body.
+
+    Returns None for a JSON body that is not an array (or is not valid JSON).
+    """
+    if request.is_json:
+        body = request.get_json(silent=True)
+        if not isinstance(body, list):
+            return None
+        return [str(value) for value in body]
+    text = request.get_data(as_text=True)
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+READ_ONLY_ENDPOINTS = ('index', 'static', 'status')
+CURSOR_LIMIT = 64
+cursors = {}    # next_cursor token -> (list, mutation count, paused iter_dicts walk)
+mutations = 0   # bumped by every request that may change a list
+cursor_serial = count()
+
+
+@app.before_request
+def count_mutation():
+    """Mark paused cursors stale whenever a request may change a list"""
+    global mutations
+    if request.endpoint not in READ_ONLY_ENDPOINTS:
+        mutations += 1
+
+
+def list_payload(lst):
+    """Whole list, or one ?offset=&limit= window; ?cursor= resumes at next_cursor.
+
+    A window that stops early parks its walk under the returned
+    next_cursor, so fetching the following page continues from there
+    instead of walking offset nodes again. If any list changed in the
+    meantime (or the cursor was evicted) the walk restarts at the offset
+    the token records. Negative offset/limit values are clamped to 0, and
+    an empty window (limit=0) issues no next_cursor.
+    """
+    token = request.args.get('cursor')
+    offset = max(0, request.args.get('offset', default=0, type=int))
+    limit = request.args.get('limit', type=int)
+    if limit is not None:
+        limit = max(0, limit)
+    paused = None
+    if token:
+        paused = cursors.pop(token, None)
+        try:
+            offset = max(0, int(token.partition('.')[0]))
+        except ValueError:
+            pass
+    elif limit is None and not offset:
+        return {"list": lst.to_list()}
+    if paused and paused[0] is lst and paused[1] == mutations:
+        walk = paused[2]
+    else:
+        walk = lst.iter_dicts(offset)
+    page = list(islice(walk, limit))
+    payload = {"offset": offset}
+    if limit:
+        following = next(walk, None)
+        if following is not None:
+            next_cursor = f"{offset + limit}.{next(cursor_serial)}"
+            cursors[next_cursor] = (lst, mutations, chain([following], walk))
+            if len(cursors) > CURSOR_LIMIT:
+                del cursors[next(iter(cursors))]
+            payload["next_cursor"] = next_cursor
+    payload["list"] = page
+    return payload
+
+
+def stream_list(lst, chunk=1000):
+    """Chunked JSON body for {"list": [...]} built while walking the list.
+
+    A request that may change a list while the body is being sent stops
+    the stream at the next chunk boundary: the unsent batch is dropped
+    (its nodes may already be back in the pool) and the body is closed
+    with an "error" field instead.
+    """
+    def generate():
+        stamp = mutations
+        yield '{"list": ['
+        sep = ''
+        batch = []
+        for node in lst.iter_dicts():
+            batch.append(json.dumps(node))
+            if len(batch) == chunk:
+                if mutations != stamp:
+                    break
+                yield sep + ','.join(batch)
+                sep, batch = ',', []
+        if mutations != stamp:
+            yield '], "error": "List changed while streaming; response is incomplete."}'
+            return
+        if batch:
+            yield sep + ','.join(batch)
+        yield ']}'
+    return Response(generate(), mimetype='application/json')
 
 # ------------------------------
 # Flask Routes
@@ -218,7 +441,16 @@ def insert_node():
         msg = circular_list.insert(value)
     else:
         msg = "No value provided."
-    return jsonify({"message": msg, "list": circular_list.to_list()})
+    return jsonify({"message": msg, **list_payload(circular_list)})
+
+@app.route('/prepend')
+def prepend_node():
+    value = request.args.get('value')
+    if value:
+        msg = circular_list.prepend(value)
+    else:
+        msg = "No value provided."
+    return jsonify({"message": msg, **list_payload(circular_list)})
 
 @app.route('/delete')
 def delete_node():
@@ -227,7 +459,35 @@ def delete_node():
         msg = circular_list.delete(value)
     else:
         msg = "No value provided for deletion."
-    return jsonify({"message": msg, "list": circular_list.to_list()})
+    return jsonify({"message": msg, **list_payload(circular_list)})
+
+@app.route('/bulk_insert', methods=['POST'])
+def bulk_insert():
+    values = bulk_values()
+    if values is None:
+        return jsonify({"message": "Body must be a JSON array or newline-delimited text."}), 400
+    msg = circular_list.extend(values)
+    return jsonify({"message": msg, "length": circular_list.length})
+
+@app.route('/bulk_delete', methods=['POST'])
+def bulk_delete():
+    values = bulk_values()
+    if values is None:
+        return jsonify({"message": "Body must be a JSON array or newline-delimited text."}), 400
+    msg = circular_list.delete_many(values)
+    return jsonify({"message": msg, "length": circular_list.length})
+
+@app.route('/rotate')
+def rotate_list():
+    k = request.args.get('k', default=1, type=int)
+    msg = circular_list.rotate(k)
+    return jsonify({"message": msg, **list_payload(circular_list)})
+
+@app.route('/status')
+def status():
+    if request.args.get('stream'):
+        return stream_list(circular_list)
+    return jsonify(list_payload(circular_list))
 
 # ------------------------------
 # Run Server
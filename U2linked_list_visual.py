@@ -1,4 +1,9 @@
-from flask import Flask, request, jsonify, render_template_string
+import json
+import random
+from collections import Counter, defaultdict, deque
+from itertools import chain, count, islice
+
+from flask import Flask, Response, request, jsonify, render_template_string
 
 app = Flask(__name__)
 
@@ -7,61 +12,459 @@ app = Flask(__name__)
 # ------------------------------
 
 class Node:
+    __slots__ = ("data", "next")
+    POOL_LIMIT = 1024
+    pool = []  # released nodes, reused by Node.new to spare the allocator
+
     def __init__(self, data):
         self.data = data
         self.next = None
-        self.addr = hex(id(self))  # Simulated memory address
 
-class LinkedList:
+    @property
+    def addr(self):
+        return hex(id(self))  # Simulated memory address, computed only for display
+
+    @classmethod
+    def new(cls, data):
+        """Take a node from the free pool, or allocate one if the pool is empty"""
+        if cls.pool:
+            node = cls.pool.pop()
+            node.data = data
+            return node
+        return cls(data)
+
+    def release(self):
+        """Return an unlinked node to the free pool"""
+        if len(Node.pool) < Node.POOL_LIMIT:
+            self.data = None
+            self.next = None
+            Node.pool.append(self)
+
+class Lanes:
+    """Express-lane links of one skip-list node: next node and hop count per level above 0"""
+    __slots__ = ("next", "width")
+
     def __init__(self):
+        self.next = []
+        self.width = []  # level-0 hops to next; 0 when next is None
+
+class LinkedList:
+    MAX_LEVEL = 32
+
+    def __init__(self, indexed=False, skiplist=False, seed=None):
         self.head = None
+        self.tail = None
+        self.length = 0
+        # Optional value -> nodes (deque, in list order) and node -> predecessor
+        # maps, so delete can find and unlink a node without walking the list
+        self.index = defaultdict(deque) if indexed else None
+        self.pred = {} if indexed else None
+        # Optional skip-list express lanes over the same nodes, keeping the
+        # list sorted: node -> Lanes, with the key None holding the head tower
+        self.lanes = {None: Lanes()} if skiplist else None
+        self.rng = random.Random(seed)
 
     def insert(self, data):
-        """Insert a new node at the end of the linked list"""
-        new_node = Node(data)
+        """Insert a new node at the end of the linked list (O(1) via tail)"""
+        if self.lanes is not None:
+            return self.insert_sorted(data)
+        new_node = Node.new(data)
+        self.length += 1
+        if self.index is not None:
+            self.index[data].append(new_node)
+            self.pred[new_node] = self.tail
         if not self.head:
-            self.head = new_node
+            self.head = self.tail = new_node
             return f"Inserted {data} as head node"
-        current = self.head
-        while current.next:
-            current = current.next
-        current.next = new_node
+        self.tail.next = new_node
+        self.tail = new_node
         return f"Inserted node with value {data}"
 
+    def prepend(self, data):
+        """Insert a new node before the head"""
+        if self.lanes is not None:
+            return "Positional inserts are disabled on a sorted list."
+        new_node = Node.new(data)
+        if self.index is not None:
+            self.index[data].appendleft(new_node)
+            self.pred[new_node] = None
+            if self.head:
+                self.pred[self.head] = new_node
+        new_node.next = self.head
+        self.head = new_node
+        if not self.tail:
+            self.tail = new_node
+        self.length += 1
+        return f"Inserted {data} as head node"
+
+    def insert_at(self, index, data):
+        """Insert a new node at position index (0 = head, length = tail)"""
+        if self.lanes is not None:
+            return "Positional inserts are disabled on a sorted list."
+        if index < 0 or index > self.length:
+            return f"Index {index} out of range (0..{self.length})."
+        if index == 0:
+            return self.prepend(data)
+        if index == self.length:
+            return self.insert(data)
+        prev = self.head
+        before = 1 if prev.data == data else 0  # equal values ahead of the new node
+        for _ in range(index - 1):
+            prev = prev.next
+            before += prev.data == data
+        new_node = Node.new(data)
+        new_node.next = prev.next
+        prev.next = new_node
+        if self.index is not None:
+            self.index[data].insert(before, new_node)
+            self.pred[new_node] = prev
+            self.pred[new_node.next] = new_node
+        self.length += 1
+        return f"Inserted node with value {data} at index {index}"
+
+    def search_path(self, data):
+        """Last node before data on every level (None = head) and its position"""
+        lanes = self.lanes
+        top = len(lanes[None].next)
+        update = [None] * (top + 1)
+        rank = [-1] * (top + 1)
+        node, pos = None, -1
+        for level in range(top, 0, -1):
+            tower = lanes[node]
+            while tower.next[level - 1] is not None and tower.next[level - 1].data < data:
+                pos += tower.width[level - 1]
+                node = tower.next[level - 1]
+                tower = lanes[node]
+            update[level], rank[level] = node, pos
+        nxt = node.next if node else self.head
+        while nxt is not None and nxt.data < data:
+            node, nxt, pos = nxt, nxt.next, pos + 1
+        update[0], rank[0] = node, pos
+        return update, rank
+
+    def insert_sorted(self, data):
+        """Insert in sorted position in expected O(log n) via the express lanes"""
+        if self.lanes is None:
+            return "Sorted inserts need a skip-list linked list."
+        update, rank = self.search_path(data)
+        prev, pos = update[0], rank[0] + 1
+        new_node = Node.new(data)
+        new_node.next = prev.next if prev else self.head
+        if prev:
+            prev.next = new_node
+        else:
+            self.head = new_node
+        if new_node.next is None:
+            self.tail = new_node
+        self.length += 1
+        if self.index is not None:
+            self.index[data].appendleft(new_node)  # first among equals
+            self.pred[new_node] = prev
+            if new_node.next:
+                self.pred[new_node.next] = new_node
+
+        height = 1
+        while height < self.MAX_LEVEL and self.rng.random() < 0.5:
+            height += 1
+        head = self.lanes[None]
+        while len(head.next) < height - 1:
+            head.next.append(None)
+            head.width.append(0)
+            update.append(None)
+            rank.append(-1)
+        if height > 1:
+            tower = self.lanes[new_node] = Lanes()
+        for level in range(1, len(update)):
+            pred = self.lanes[update[level]]
+            if level < height:
+                old_next = pred.next[level - 1]
+                tower.next.append(old_next)
+                tower.width.append(rank[level] + pred.width[level - 1] + 1 - pos if old_next else 0)
+                pred.next[level - 1] = new_node
+                pred.width[level - 1] = pos - rank[level]
+            elif pred.next[level - 1] is not None:
+                pred.width[level - 1] += 1
+        return f"Inserted {data} at index {pos} (height {height})"
+
+    def unlink_lanes(self, data):
+        """Find the first node holding data and unhook it from the express lanes"""
+        update, rank = self.search_path(data)
+        prev = update[0]
+        current = prev.next if prev else self.head
+        if current is None or current.data != data:
+            return None, None
+        tower = self.lanes.pop(current, None)
+        for level in range(1, len(update)):
+            pred = self.lanes[update[level]]
+            if pred.next[level - 1] is current:
+                pred.next[level - 1] = tower.next[level - 1]
+                if tower.next[level - 1] is None:
+                    pred.width[level - 1] = 0
+                else:
+                    pred.width[level - 1] += tower.width[level - 1] - 1
+            elif pred.next[level - 1] is not None:
+                pred.width[level - 1] -= 1
+        head = self.lanes[None]
+        while head.next and head.next[-1] is None:
+            head.next.pop()
+            head.width.pop()
+        return current, prev
+
+    def get(self, index):
+        """Node at position index (express lanes make it O(log n) on sorted lists)"""
+        if index < 0 or index >= self.length:
+            return None
+        node, pos = None, -1
+        if self.lanes is not None:
+            for level in range(len(self.lanes[None].next), 0, -1):
+                tower = self.lanes[node]
+                while tower.next[level - 1] is not None and pos + tower.width[level - 1] <= index:
+                    pos += tower.width[level - 1]
+                    node = tower.next[level - 1]
+                    tower = self.lanes[node]
+        while pos < index:
+            node = node.next if node else self.head
+            pos += 1
+        return node
+
+    def search(self, data):
+        """Position of the first node holding data, or -1"""
+        if self.lanes is not None:
+            update, rank = self.search_path(data)
+            nxt = update[0].next if update[0] else self.head
+            return rank[0] + 1 if nxt is not None and nxt.data == data else -1
+        current, pos = self.head, 0
+        while current:
+            if current.data == data:
+                return pos
+            current, pos = current.next, pos + 1
+        return -1
+
+    def find(self, data):
+        """Return (node, predecessor) of the first node with given data"""
+        if self.index is not None:
+            nodes = self.index.get(data)
+            if not nodes:
+                return None, None
+            return nodes[0], self.pred[nodes[0]]
+        prev, current = None, self.head
+        while current and current.data != data:
+            prev = current
+            current = current.next
+        return current, prev
+
     def delete(self, data):
         """Delete the first node with given data"""
         if not self.head:
             return "List is empty — nothing to delete."
-        if self.head.data == data:
-            deleted_addr = self.head.addr
-            self.head = self.head.next
-            return f"Deleted head node with value {data} (addr: {deleted_addr})"
-        current = self.head
-        prev = None
-        while current and current.data != data:
-            prev = current
-            current = current.next
+        if self.lanes is not None:
+            current, prev = self.unlink_lanes(data)
+        else:
+            current, prev = self.find(data)
         if current is None:
             return f"Node with value {data} not found."
-        prev.next = current.next
-        return f"Deleted node with value {data} (addr: {current.addr})"
-
-    def to_list(self):
-        """Return structured list with data + address info"""
-        result = []
-        current = self.head
+        if prev is None:
+            msg = f"Deleted head node with value {data} (addr: {current.addr})"
+        else:
+            msg = f"Deleted node with value {data} (addr: {current.addr})"
+        self.unlink(current, prev)
+        return msg
+
+    def unlink(self, current, prev):
+        """Remove the first node holding its value, given its predecessor, and pool it"""
+        if self.index is not None:
+            nodes = self.index[current.data]
+            nodes.popleft()
+            if not nodes:
+                del self.index[current.data]
+            del self.pred[current]
+            if current.next:
+                self.pred[current.next] = prev
+        if current is self.tail:
+            self.tail = prev
+        self.length -= 1
+        if prev is None:
+            self.head = current.next
+        else:
+            prev.next = current.next
+        current.release()
+
+    def extend(self, values):
+        """Append every value, linking each new node straight after the tail"""
+        count = 0
+        for data in values:
+            count += 1
+            if self.lanes is not None:
+                self.insert_sorted(data)
+                continue
+            new_node = Node.new(data)
+            if self.index is not None:
+                self.index[data].append(new_node)
+                self.pred[new_node] = self.tail
+            if self.tail:
+                self.tail.next = new_node
+            else:
+                self.head = new_node
+            self.tail = new_node
+            self.length += 1
+        if not count:
+            return "No values to insert."
+        return f"Inserted {count} nodes"
+
+    def delete_many(self, values):
+        """Delete the first occurrence of each value (repeats delete more) in one pass"""
+        wanted = Counter(values)
+        requested = remaining = sum(wanted.values())
+        if self.lanes is not None:
+            for data in values:
+                current, prev = self.unlink_lanes(data)
+                if current is not None:
+                    self.unlink(current, prev)
+                    remaining -= 1
+        else:
+            prev, current = None, self.head
+            while current and remaining:
+                nxt = current.next
+                if wanted[current.data]:
+                    wanted[current.data] -= 1
+                    remaining -= 1
+                    self.unlink(current, prev)
+                else:
+                    prev = current
+                current = nxt
+        return f"Deleted {requested - remaining} of {requested} values"
+
+    def iter_dicts(self, offset=0):
+        """Yield node dicts in list order, starting at position offset"""
+        current = self.get(offset) if offset else self.head
+        lanes = self.lanes
         while current:
-            result.append({
+            node = {
                 "data": current.data,
                 "addr": current.addr,
                 "next": current.next.addr if current.next else None
-            })
+            }
+            if lanes is not None:
+                node["height"] = len(lanes[current].next) + 1 if current in lanes else 1
+            yield node
             current = current.next
-        return result
 
-
-# Create global linked list instance
-linked_list = LinkedList()
+    def to_list(self, offset=0, limit=None):
+        """Return structured list with data + address info (optionally one window)"""
+        return list(islice(self.iter_dicts(offset), limit))
+
+
+# Create global linked list instances: insertion order and skip-list sorted
+lists = {
+    "plain": LinkedList(indexed=True),
+    "sorted": LinkedList(indexed=True, skiplist=True),
+}
+linked_list = lists["plain"]
+
+
+def selected_list():
+    """List chosen by the ?mode= query parameter (default insertion order)"""
+    return lists.get(request.args.get('mode', 'plain'))
+
+
+def bulk_values():
+    """Values from a JSON array body or a newline-delimited text body.
+
+    Returns None for a JSON body that is not an array (or is not valid JSON).
+    """
+    if request.is_json:
+        body = request.get_json(silent=True)
+        if not isinstance(body, list):
+            return None
+        return [str(value) for value in body]
+    text = request.get_data(as_text=True)
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+READ_ONLY_ENDPOINTS = ('index', 'static', 'status', 'search_node')
+CURSOR_LIMIT = 64
+cursors = {}    # next_cursor token -> (list, mutation count, paused iter_dicts walk)
+mutations = 0   # bumped by every request that may change a list
+cursor_serial = count()
+
+
+@app.before_request
+def count_mutation():
+    """Mark paused cursors stale whenever a request may change a list"""
+    global mutations
+    if request.endpoint not in READ_ONLY_ENDPOINTS:
+        mutations += 1
+
+
+def list_payload(lst):
+    """Whole list, or one ?offset=&limit= window; ?cursor= resumes at next_cursor.
+
+    A window that stops early parks its walk under the returned
+    next_cursor, so fetching the following page continues from there
+    instead of walking offset nodes again. If any list changed in the
+    meantime (or the cursor was evicted) the walk restarts at the offset
+    the token records. Negative offset/limit values are clamped to 0, and
+    an empty window (limit=0) issues no next_cursor.
+    """
+    token = request.args.get('cursor')
+    offset = max(0, request.args.get('offset', default=0, type=int))
+    limit = request.args.get('limit', type=int)
+    if limit is not None:
+        limit = max(0, limit)
+    paused = None
+    if token:
+        paused = cursors.pop(token, None)
+        try:
+            offset = max(0, int(token.partition('.')[0]))
+        except ValueError:
+            pass
+    elif limit is None and not offset:
+        return {"list": lst.to_list()}
+    if paused and paused[0] is lst and paused[1] == mutations:
+        walk = paused[2]
+    else:
+        walk = lst.iter_dicts(offset)
+    page = list(islice(walk, limit))
+    payload = {"offset": offset}
+    if limit:
+        following = next(walk, None)
+        if following is not None:
+            next_cursor = f"{offset + limit}.{next(cursor_serial)}"
+            cursors[next_cursor] = (lst, mutations, chain([following], walk))
+            if len(cursors) > CURSOR_LIMIT:
+                del cursors[next(iter(cursors))]
+            payload["next_cursor"] = next_cursor
+    payload["list"] = page
+    return payload
+
+
+def stream_list(lst, chunk=1000):
+    """Chunked JSON body for {"list": [...]} built while walking the list.
+
+    A request that may change a list while the body is being sent stops
+    the stream at the next chunk boundary: the unsent batch is dropped
+    (its nodes may already be back in the pool) and the body is closed
+    with an "error" field instead.
+    """
+    def generate():
+        stamp = mutations
+        yield '{"list": ['
+        sep = ''
+        batch = []
+        for node in lst.iter_dicts():
+            batch.append(json.dumps(node))
+            if len(batch) == chunk:
+                if mutations != stamp:
+                    break
+                yield sep + ','.join(batch)
+                sep, batch = ',', []
+        if mutations != stamp:
+            yield '], "error": "List changed while streaming; response is incomplete."}'
+            return
+        if batch:
+            yield sep + ','.join(batch)
+        yield ']}'
+    return Response(generate(), mimetype='application/json')
 
 # ------------------------------
 # Flask Routes
@@ -85,19 +488,42 @@ def index():
         <h2>🧠 Singly Linked List Visualization (Data on Top, Address Below)</h2>
 
         <div>
+            <select id="mode" onchange="refresh()">
+                <option value="plain">Insertion Order</option>
+                <option value="sorted">Sorted (Skip List)</option>
+            </select>
             <input type="text" id="nodeValue" placeholder="Enter node value">
             <button onclick="insertNode()">Insert Node</button>
             <button onclick="deleteNode()">Delete Node</button>
+            <button onclick="searchNode()">Search</button>
         </div>
 
         <p id="status"></p>
         <canvas id="canvas" width="1500" height="500"></canvas>
 
         <script>
+            function mode() {
+                return '&mode=' + document.getElementById("mode").value;
+            }
+
+            async function refresh() {
+                let res = await fetch('/status?' + mode());
+                let data = await res.json();
+                drawList(data.list);
+            }
+
+            async function searchNode() {
+                let val = document.getElementById("nodeValue").value;
+                if(!val) return alert("Enter a value to search");
+                let res = await fetch('/search?value=' + val + mode());
+                let data = await res.json();
+                document.getElementById("status").innerText = data.message;
+            }
+
             async function insertNode() {
                 let val = document.getElementById("nodeValue").value;
                 if(!val) return alert("Enter a value");
-                let res = await fetch('/insert?value=' + val);
+                let res = await fetch('/insert?value=' + val + mode());
                 let data = await res.json();
                 document.getElementById("status").innerText = data.message;
                 drawList(data.list);
@@ -106,7 +532,7 @@ def index():
             async function deleteNode() {
                 let val = document.getElementById("nodeValue").value;
                 if(!val) return alert("Enter a value to delete");
-                let res = await fetch('/delete?value=' + val);
+                let res = await fetch('/delete?value=' + val + mode());
                 let data = await res.json();
                 document.getElementById("status").innerText = data.message;
                 drawList(data.list);
@@ -151,6 +577,13 @@ def index():
                     ctx.font = "14px Arial";
                     ctx.fillText(node.addr, x + 70, y + 65);
 
+                    // Skip-list tower: one bar per express lane above the node
+                    for (let level = 1; level < (node.height || 1); level++) {
+                        ctx.fillStyle = "#93c5fd";
+                        ctx.fillRect(x, y - 14 * level, 140, 10);
+                        ctx.fillStyle = "#000";
+                    }
+
                     // Next pointer section (right side)
                     ctx.textAlign = "left";
                     ctx.font = "14px Arial";
@@ -187,22 +620,92 @@ def index():
 
 @app.route('/insert')
 def insert_node():
+    linked_list = selected_list()
+    if linked_list is None:
+        return jsonify({"message": "Unknown list mode."}), 400
     value = request.args.get('value')
-    if value:
+    index = request.args.get('index', type=int)
+    if not value:
+        msg = "No value provided."
+    elif index is not None:
+        msg = linked_list.insert_at(index, value)
+    else:
         msg = linked_list.insert(value)
+    return jsonify({"message": msg, **list_payload(linked_list)})
+
+
+@app.route('/prepend')
+def prepend_node():
+    linked_list = selected_list()
+    if linked_list is None:
+        return jsonify({"message": "Unknown list mode."}), 400
+    value = request.args.get('value')
+    if value:
+        msg = linked_list.prepend(value)
     else:
         msg = "No value provided."
-    return jsonify({"message": msg, "list": linked_list.to_list()})
+    return jsonify({"message": msg, **list_payload(linked_list)})
 
 
 @app.route('/delete')
 def delete_node():
+    linked_list = selected_list()
+    if linked_list is None:
+        return jsonify({"message": "Unknown list mode."}), 400
     value = request.args.get('value')
     if value:
         msg = linked_list.delete(value)
     else:
         msg = "No value provided for deletion."
-    return jsonify({"message": msg, "list": linked_list.to_list()})
+    return jsonify({"message": msg, **list_payload(linked_list)})
+
+
+@app.route('/bulk_insert', methods=['POST'])
+def bulk_insert():
+    linked_list = selected_list()
+    if linked_list is None:
+        return jsonify({"message": "Unknown list mode."}), 400
+    values = bulk_values()
+    if values is None:
+        return jsonify({"message": "Body must be a JSON array or newline-delimited text."}), 400
+    msg = linked_list.extend(values)
+    return jsonify({"message": msg, "length": linked_list.length})
+
+
+@app.route('/bulk_delete', methods=['POST'])
+def bulk_delete():
+    linked_list = selected_list()
+    if linked_list is None:
+        return jsonify({"message": "Unknown list mode."}), 400
+    values = bulk_values()
+    if values is None:
+        return jsonify({"message": "Body must be a JSON array or newline-delimited text."}), 400
+    msg = linked_list.delete_many(values)
+    return jsonify({"message": msg, "length": linked_list.length})
+
+
+@app.route('/search')
+def search_node():
+    linked_list = selected_list()
+    if linked_list is None:
+        return jsonify({"message": "Unknown list mode."}), 400
+    value = request.args.get('value')
+    if not value:
+        return jsonify({"message": "No value provided."})
+    index = linked_list.search(value)
+    if index < 0:
+        return jsonify({"message": f"Node with value {value} not found.", "index": index})
+    return jsonify({"message": f"Found {value} at index {index}", "index": index})
+
+
+@app.route('/status')
+def status():
+    linked_list = selected_list()
+    if linked_list is None:
+        return jsonify({"message": "Unknown list mode."}), 400
+    if request.args.get('stream'):
+        return stream_list(linked_list)
+    return jsonify(list_payload(linked_list))
 
 
 # ------------------------------
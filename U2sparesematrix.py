@@ -1,6 +1,22 @@
+import io
+import mmap
+import os
+import struct
+import zipfile
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
 from flask import Flask, request, jsonify, render_template_string
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: from_coo falls back to pure Python
+    np = None
+
 app = Flask(__name__)
+# Directory that /save writes and /open maps matrix files from
+app.config.setdefault("MATRIX_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "matrices"))
 
 # ------------------------------
 # Sparse Matrix (Triplet Linked Representation)
@@ -13,6 +29,15 @@ class Node:
         self.val = val
         self.next = None
 
+def position_error(matrix, row=0, col=0):
+    """Message when (row, col) lies outside matrix, or None when it is inside"""
+    if row is None or col is None:
+        return "Row and column must be integers."
+    if not (0 <= row < matrix.rows and 0 <= col < matrix.cols):
+        return f"Position ({row}, {col}) is outside the {matrix.rows}x{matrix.cols} matrix."
+    return None
+
+
 class SparseMatrix:
     def __init__(self, rows, cols):
         self.rows = rows
@@ -21,6 +46,9 @@ class SparseMatrix:
 
     def insert(self, row, col, val):
         """Insert a non-zero element in sorted order (row-major)."""
+        error = position_error(self, row, col)
+        if error:
+            return error
         if val == 0:
             return "Zero value not stored in sparse matrix."
 
@@ -47,6 +75,9 @@ class SparseMatrix:
 
     def delete(self, row, col):
         """Delete an element from the sparse matrix."""
+        error = position_error(self, row, col)
+        if error:
+            return error
         if self.head is None:
             return "Matrix is empty."
         curr = self.head
@@ -62,6 +93,128 @@ class SparseMatrix:
             curr = curr.next
         return f"No element found at ({row}, {col})."
 
+    def get(self, row, col):
+        """Value at (row, col), or 0 when it is not stored"""
+        curr = self.head
+        while curr and (curr.row < row or (curr.row == row and curr.col < col)):
+            curr = curr.next
+        if curr and curr.row == row and curr.col == col:
+            return curr.val
+        return 0
+
+    def row(self, row):
+        """Non-zero elements of one row as list of dicts"""
+        return [e for e in self.to_list() if e["row"] == row]
+
+    def column(self, col):
+        """Non-zero elements of one column as list of dicts"""
+        return [e for e in self.to_list() if e["col"] == col]
+
+    def iter_triplets(self):
+        """Yield (row, col, val) in row-major order"""
+        curr = self.head
+        while curr:
+            yield curr.row, curr.col, curr.val
+            curr = curr.next
+
+    @classmethod
+    def from_triplets(cls, rows, cols, triplets):
+        """Build from (row, col, val) already in row-major order, appending at the tail"""
+        matrix = cls(rows, cols)
+        tail = None
+        for row, col, val in triplets:
+            node = Node(row, col, val)
+            if tail:
+                tail.next = node
+            else:
+                matrix.head = node
+            tail = node
+        return matrix
+
+    @classmethod
+    def from_coo(cls, row, col, val, shape=None):
+        """Build from COO index/value arrays in any order; duplicates are summed."""
+        rows, cols, triplets = coo_triplets(row, col, val, shape)
+        return cls.from_triplets(rows, cols, triplets)
+
+    # ---- Arithmetic: every result is a new SparseMatrix built in one pass ----
+
+    def add(self, other):
+        """Element-wise sum, merging the two row-major lists like sorted runs"""
+        if (self.rows, self.cols) != (other.rows, other.cols):
+            raise ValueError(f"Cannot add {self.rows}x{self.cols} and {other.rows}x{other.cols} matrices.")
+
+        def merged():
+            a, b = self.head, other.head
+            while a or b:
+                if b is None or (a and (a.row, a.col) < (b.row, b.col)):
+                    yield a.row, a.col, a.val
+                    a = a.next
+                elif a is None or (b.row, b.col) < (a.row, a.col):
+                    yield b.row, b.col, b.val
+                    b = b.next
+                else:
+                    if a.val + b.val != 0:
+                        yield a.row, a.col, a.val + b.val
+                    a, b = a.next, b.next
+
+        return SparseMatrix.from_triplets(self.rows, self.cols, merged())
+
+    def subtract(self, other):
+        """Element-wise difference"""
+        return self.add(other.scale(-1))
+
+    def scale(self, k):
+        """Multiply every element by the scalar k"""
+        if k == 0:
+            return SparseMatrix(self.rows, self.cols)
+        return SparseMatrix.from_triplets(
+            self.rows, self.cols, ((row, col, val * k) for row, col, val in self.iter_triplets()))
+
+    def transpose(self):
+        """Swap rows and columns with a counting sort by column (O(nnz + cols))"""
+        by_col = CompressedSparseMatrix.from_matrix(self, order="col")
+        return SparseMatrix.from_triplets(
+            self.cols, self.rows, ((col, row, val) for row, col, val in by_col.iter_triplets()))
+
+    def row_lists(self):
+        """Dict of row -> [(col, val), ...] for the non-empty rows"""
+        result = {}
+        for row, col, val in self.iter_triplets():
+            result.setdefault(row, []).append((col, val))
+        return result
+
+    def multiply(self, other):
+        """Matrix-vector product (SpMV) for a sequence, matrix product (SpGEMM) for a matrix.
+
+        SpGEMM is row-by-row (Gustavson): each non-zero A[i, k] scatters
+        A[i, k] * B[k, :] into an accumulator for row i, so the work is
+        proportional to the multiply-adds actually performed.
+        """
+        if not isinstance(other, SparseMatrix):
+            vector = list(other)
+            if len(vector) != self.cols:
+                raise ValueError(f"Cannot multiply {self.rows}x{self.cols} matrix by vector of length {len(vector)}.")
+            result = [0] * self.rows
+            for row, col, val in self.iter_triplets():
+                result[row] += val * vector[col]
+            return result
+        if self.cols != other.rows:
+            raise ValueError(f"Cannot multiply {self.rows}x{self.cols} and {other.rows}x{other.cols} matrices.")
+        b_rows = other.row_lists()
+
+        def products():
+            for row, entries in sorted(self.row_lists().items()):
+                acc = {}
+                for k, a in entries:
+                    for col, b in b_rows.get(k, ()):
+                        acc[col] = acc.get(col, 0) + a * b
+                for col in sorted(acc):
+                    if acc[col] != 0:
+                        yield row, col, acc[col]
+
+        return SparseMatrix.from_triplets(self.rows, other.cols, products())
+
     def to_list(self):
         """Return all non-zero elements as list of dicts."""
         result = []
@@ -76,10 +229,547 @@ class SparseMatrix:
         return result
 
 
+def coo_triplets(row, col, val, shape=None):
+    """Sort COO arrays row-major, sum duplicates and drop zeros.
+
+    Returns (rows, cols, triplets) with triplets as a zip of plain Python
+    values. With NumPy this is a lexsort plus add.reduceat over the runs
+    of equal (row, col) keys; without it, a dict accumulation and a sort.
+    Raises ValueError for mismatched lengths, non-integer indices, values
+    that are not integer, float or bool, negative indices, or indices
+    outside shape.
+    """
+    if np is not None:
+        row, col, val = np.asarray(row), np.asarray(col), np.asarray(val)
+        if not row.shape == col.shape == val.shape or row.ndim != 1:
+            raise ValueError("COO row, col and val arrays must be one-dimensional and the same length.")
+        if row.size and (row.dtype.kind not in "iu" or col.dtype.kind not in "iu"):
+            raise ValueError("COO indices must be integers.")
+        if val.size and val.dtype.kind not in "iufb":
+            raise ValueError("COO values must be integer, float or bool.")
+        row, col = row.astype(np.int64), col.astype(np.int64)
+        if val.dtype.kind == "b":
+            val = val.astype(np.int64)
+        if row.size and (row.min() < 0 or col.min() < 0):
+            raise ValueError("COO indices must not be negative.")
+        if shape is None:
+            shape = (int(row.max()) + 1 if row.size else 0, int(col.max()) + 1 if col.size else 0)
+        elif row.size and (row.max() >= shape[0] or col.max() >= shape[1]):
+            raise ValueError(f"COO indices fall outside the {shape[0]}x{shape[1]} shape.")
+        order = np.lexsort((col, row))
+        row, col, val = row[order], col[order], val[order]
+        if row.size:
+            starts = np.flatnonzero(np.r_[True, (np.diff(row) != 0) | (np.diff(col) != 0)])
+            row, col, val = row[starts], col[starts], np.add.reduceat(val, starts)
+            keep = val != 0
+            row, col, val = row[keep], col[keep], val[keep]
+        return shape[0], shape[1], zip(row.tolist(), col.tolist(), val.tolist())
+    row, col, val = list(row), list(col), list(val)
+    if not len(row) == len(col) == len(val):
+        raise ValueError("COO row, col and val arrays must be one-dimensional and the same length.")
+    if not all(isinstance(i, int) for i in row + col):
+        raise ValueError("COO indices must be integers.")
+    if not all(isinstance(v, (int, float)) for v in val):
+        raise ValueError("COO values must be integer, float or bool.")
+    val = [int(v) if isinstance(v, bool) else v for v in val]
+    if min(row, default=0) < 0 or min(col, default=0) < 0:
+        raise ValueError("COO indices must not be negative.")
+    if shape is None:
+        shape = (max(row, default=-1) + 1, max(col, default=-1) + 1)
+    elif max(row, default=-1) >= shape[0] or max(col, default=-1) >= shape[1]:
+        raise ValueError(f"COO indices fall outside the {shape[0]}x{shape[1]} shape.")
+    acc = {}
+    for r, c, v in zip(row, col, val):
+        acc[r, c] = acc.get((r, c), 0) + v
+    return shape[0], shape[1], ((r, c, acc[r, c]) for r, c in sorted(acc) if acc[r, c] != 0)
+
+
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def fits_int64(value):
+    return isinstance(value, int) and INT64_MIN <= value <= INT64_MAX
+
+
+def value_array(values=()):
+    """array('q') for int64-range integers, array('d') once any value is a float
+    or an integer too wide for int64; ValueError beyond the float64 range"""
+    values = list(values)
+    if all(fits_int64(v) for v in values):
+        return array('q', values)
+    try:
+        return array('d', values)
+    except OverflowError:
+        raise ValueError("Value is too large to store in a compressed matrix.") from None
+
+
+class CompressedSparseMatrix:
+    """Compressed sparse row (order="row") or column (order="col") storage.
+
+    Three flat arrays: indptr[i]:indptr[i+1] is the slice of indices/data
+    belonging to row i (CSR) or column i (CSC), with indices sorted inside
+    each slice. get() and row() bisect that slice, so a lookup is
+    O(log row-nnz); insert and delete shift the arrays and stay O(nnz).
+    Same insert/delete/to_list API as SparseMatrix.
+    """
+
+    def __init__(self, rows, cols, order="row"):
+        self.rows = rows
+        self.cols = cols
+        self.order = order
+        self.indptr = array('q', [0] * ((rows if order == "row" else cols) + 1))
+        self.indices = array('q')
+        self.data = value_array()
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    def axes(self, row, col):
+        """(major, minor) position of (row, col) for this storage order"""
+        return (row, col) if self.order == "row" else (col, row)
+
+    def locate(self, major, minor):
+        """Position of minor inside the major slice, and whether it is stored there"""
+        lo, hi = self.indptr[major], self.indptr[major + 1]
+        pos = bisect_left(self.indices, minor, lo, hi)
+        return pos, pos < hi and self.indices[pos] == minor
+
+    def insert(self, row, col, val):
+        """Insert or update a non-zero element, keeping each slice sorted."""
+        error = position_error(self, row, col)
+        if error:
+            return error
+        if val == 0:
+            return "Zero value not stored in sparse matrix."
+        try:
+            float(val)
+        except OverflowError:
+            return f"Value {val} is too large to store in a compressed matrix."
+        if self.data.typecode == 'q' and not fits_int64(val):
+            self.data = array('d', self.data)  # floats and integers wider than int64
+        major, minor = self.axes(row, col)
+        pos, found = self.locate(major, minor)
+        if found:
+            self.data[pos] = val
+            return f"Updated value at ({row}, {col}) to {val}."
+        self.indices.insert(pos, minor)
+        self.data.insert(pos, val)
+        for i in range(major + 1, len(self.indptr)):
+            self.indptr[i] += 1
+        return f"Inserted value {val} at ({row}, {col})."
+
+    def delete(self, row, col):
+        """Delete an element from the sparse matrix."""
+        error = position_error(self, row, col)
+        if error:
+            return error
+        if not self.nnz:
+            return "Matrix is empty."
+        major, minor = self.axes(row, col)
+        pos, found = self.locate(major, minor)
+        if not found:
+            return f"No element found at ({row}, {col})."
+        del self.indices[pos]
+        del self.data[pos]
+        for i in range(major + 1, len(self.indptr)):
+            self.indptr[i] -= 1
+        return f"Deleted element at ({row}, {col})."
+
+    def get(self, row, col):
+        """Value at (row, col), or 0 when it is not stored"""
+        pos, found = self.locate(*self.axes(row, col))
+        return self.data[pos] if found else 0
+
+    def row(self, row):
+        """Non-zero elements of one row as list of dicts (a slice under CSR)"""
+        if self.order != "row":
+            return [e for e in self.to_list() if e["row"] == row]
+        lo, hi = self.indptr[row], self.indptr[row + 1]
+        return [{"row": row, "col": self.indices[k], "val": self.data[k]} for k in range(lo, hi)]
+
+    def column(self, col):
+        """Non-zero elements of one column as list of dicts (a slice under CSC)"""
+        if self.order == "row":
+            return [e for e in self.to_list() if e["col"] == col]
+        lo, hi = self.indptr[col], self.indptr[col + 1]
+        return [{"row": self.indices[k], "col": col, "val": self.data[k]} for k in range(lo, hi)]
+
+    def iter_triplets(self):
+        """Yield (row, col, val) in storage order (row-major for CSR, column-major for CSC)"""
+        indptr, indices, data = self.indptr, self.indices, self.data
+        for major in range(len(indptr) - 1):
+            for k in range(indptr[major], indptr[major + 1]):
+                if self.order == "row":
+                    yield major, indices[k], data[k]
+                else:
+                    yield indices[k], major, data[k]
+
+    @classmethod
+    def from_triplets(cls, rows, cols, triplets, order="row"):
+        """Counting-sort (row, col, val) triplets into the three arrays in O(nnz + n).
+
+        The sort is stable, so row-major input gives sorted column slices too.
+        """
+        matrix = cls(rows, cols, order)
+        triplets = [matrix.axes(row, col) + (val,) for row, col, val in triplets]
+        indptr = matrix.indptr
+        for major, _, _ in triplets:
+            indptr[major + 1] += 1
+        for i in range(1, len(indptr)):
+            indptr[i] += indptr[i - 1]
+        slot = array('q', indptr[:-1])
+        indices = array('q', [0] * len(triplets))
+        values = [0] * len(triplets)
+        for major, minor, val in triplets:
+            k = slot[major]
+            indices[k] = minor
+            values[k] = val
+            slot[major] = k + 1
+        matrix.indices = indices
+        matrix.data = value_array(values)
+        return matrix
+
+    @classmethod
+    def from_coo(cls, row, col, val, shape=None, order="row"):
+        """Build from COO index/value arrays in any order; duplicates are summed."""
+        rows, cols, triplets = coo_triplets(row, col, val, shape)
+        return cls.from_triplets(rows, cols, triplets, order)
+
+    def save(self, path):
+        """Write the matrix in the MappedSparseMatrix file layout (always CSR).
+
+        The file is written beside path and renamed over it, so a mapping of
+        the old file keeps its own (now unlinked) copy instead of being
+        truncated underneath it.
+        """
+        csr = self if self.order == "row" else CompressedSparseMatrix.from_matrix(self)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(struct.pack(MappedSparseMatrix.HEADER, MappedSparseMatrix.MAGIC, MappedSparseMatrix.VERSION,
+                                    csr.rows, csr.cols, csr.nnz, csr.data.typecode.encode()))
+                csr.indptr.tofile(f)
+                csr.indices.tofile(f)
+                csr.data.tofile(f)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    @classmethod
+    def from_matrix(cls, matrix, order="row"):
+        """Convert a linked SparseMatrix (or another compressed one)"""
+        return cls.from_triplets(matrix.rows, matrix.cols, matrix.iter_triplets(), order)
+
+    def to_matrix(self):
+        """Convert back to the linked triplet SparseMatrix"""
+        triplets = self.iter_triplets()
+        if self.order != "row":
+            triplets = CompressedSparseMatrix.from_triplets(self.rows, self.cols, triplets).iter_triplets()
+        return SparseMatrix.from_triplets(self.rows, self.cols, triplets)
+
+    def to_list(self):
+        """Return all non-zero elements as list of dicts (storage order)."""
+        return [{"row": row, "col": col, "val": val} for row, col, val in self.iter_triplets()]
+
+
+class MappedSparseMatrix:
+    """Read-only CSR matrix served straight from a memory-mapped file.
+
+    File layout (native little-endian): a 40-byte header (magic, version,
+    rows, cols, nnz, value typecode 'q' or 'd'), then int64 indptr[rows + 1],
+    int64 indices[nnz] and data[nnz]. The three arrays are memoryview casts
+    over the mapping, so opening a file copies nothing and the OS pages in
+    only the rows a query touches. Write files with CompressedSparseMatrix.save.
+    """
+    MAGIC = b"SPMX"
+    VERSION = 1
+    HEADER = "<4sIQQQc7x"
+
+    def __init__(self, path):
+        self.path = path
+        self.order = "row"
+        size = struct.calcsize(self.HEADER)
+        self.file = open(path, "rb")
+        file_size = os.fstat(self.file.fileno()).st_size
+        if file_size < size:
+            self.file.close()
+            raise ValueError(f"{os.path.basename(path)} is not a sparse matrix file.")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.rows, self.cols, nnz, typecode = struct.unpack_from(self.HEADER, self.map)
+        if magic != self.MAGIC or version != self.VERSION or typecode not in (b"q", b"d"):
+            self.close()
+            raise ValueError(f"{os.path.basename(path)} is not a sparse matrix file.")
+        if file_size != size + 8 * (self.rows + 1) + 16 * nnz:
+            self.close()
+            raise ValueError(f"{os.path.basename(path)} is truncated or has the wrong size.")
+        view = memoryview(self.map)
+        offset = size
+        self.indptr = view[offset:offset + 8 * (self.rows + 1)].cast('q')
+        offset += 8 * (self.rows + 1)
+        self.indices = view[offset:offset + 8 * nnz].cast('q')
+        offset += 8 * nnz
+        self.data = view[offset:offset + 8 * nnz].cast(typecode.decode())
+
+    def close(self):
+        """Release the array views, then the mapping and the file"""
+        for name in ("indptr", "indices", "data"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self.map.close()
+        self.file.close()
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    def insert(self, row, col, val):
+        return "Memory-mapped matrix is read-only."
+
+    def delete(self, row, col):
+        return "Memory-mapped matrix is read-only."
+
+    def get(self, row, col):
+        """Value at (row, col), or 0 when it is not stored (bisects one row slice)"""
+        lo, hi = self.indptr[row], self.indptr[row + 1]
+        pos = bisect_left(self.indices, col, lo, hi)
+        return self.data[pos] if pos < hi and self.indices[pos] == col else 0
+
+    def row(self, row):
+        """Non-zero elements of one row as list of dicts (one slice of the mapping)"""
+        lo, hi = self.indptr[row], self.indptr[row + 1]
+        return [{"row": row, "col": col, "val": val}
+                for col, val in zip(self.indices[lo:hi].tolist(), self.data[lo:hi].tolist())]
+
+    def column(self, col):
+        """Non-zero elements of one column as list of dicts"""
+        return [{"row": r, "col": c, "val": v} for r, c, v in self.iter_triplets() if c == col]
+
+    def iter_triplets(self, offset=0):
+        """Yield (row, col, val) in row-major order, starting at non-zero number offset"""
+        indptr, indices, data = self.indptr, self.indices, self.data
+        row = bisect_right(indptr, offset) - 1
+        for k in range(offset, self.nnz):
+            while indptr[row + 1] <= k:
+                row += 1
+            yield row, indices[k], data[k]
+
+    def to_list(self, offset=0, limit=None):
+        """Return non-zero elements as list of dicts (optionally one window)"""
+        return [{"row": row, "col": col, "val": val}
+                for row, col, val in islice(self.iter_triplets(offset), limit)]
+
+
+class CrossNode:
+    __slots__ = ("row", "col", "val", "right", "down")
+
+    def __init__(self, row, col, val):
+        self.row = row
+        self.col = col
+        self.val = val
+        self.right = None  # next non-zero in the same row
+        self.down = None  # next non-zero in the same column
+
+
+class OrthogonalSparseMatrix:
+    """Orthogonal (cross-linked) list: every node sits on a row chain and a column chain.
+
+    row_heads[r] and col_heads[c] start the chains, each sorted by the other
+    coordinate. insert/delete walk only one row chain and one column chain,
+    and column() is a direct walk instead of a full scan.
+    Same insert/delete/to_list API as SparseMatrix.
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.row_heads = [None] * rows
+        self.col_heads = [None] * cols
+        self.nnz = 0
+
+    def find_in_row(self, row, col):
+        """(prev, curr) where curr is the first node in row with column >= col"""
+        prev, curr = None, self.row_heads[row]
+        while curr and curr.col < col:
+            prev, curr = curr, curr.right
+        return prev, curr
+
+    def find_in_col(self, row, col):
+        """(prev, curr) where curr is the first node in col with row >= row"""
+        prev, curr = None, self.col_heads[col]
+        while curr and curr.row < row:
+            prev, curr = curr, curr.down
+        return prev, curr
+
+    def insert(self, row, col, val):
+        """Insert a non-zero element into its row and column chains."""
+        error = position_error(self, row, col)
+        if error:
+            return error
+        if val == 0:
+            return "Zero value not stored in sparse matrix."
+        left, curr = self.find_in_row(row, col)
+        if curr and curr.col == col:
+            curr.val = val
+            return f"Updated value at ({row}, {col}) to {val}."
+        node = CrossNode(row, col, val)
+        self.nnz += 1
+        node.right = curr
+        if left:
+            left.right = node
+        else:
+            self.row_heads[row] = node
+        up, below = self.find_in_col(row, col)
+        node.down = below
+        if up:
+            up.down = node
+        else:
+            self.col_heads[col] = node
+        return f"Inserted value {val} at ({row}, {col})."
+
+    def delete(self, row, col):
+        """Delete an element from its row and column chains."""
+        error = position_error(self, row, col)
+        if error:
+            return error
+        if not self.nnz:
+            return "Matrix is empty."
+        left, curr = self.find_in_row(row, col)
+        if not curr or curr.col != col:
+            return f"No element found at ({row}, {col})."
+        if left:
+            left.right = curr.right
+        else:
+            self.row_heads[row] = curr.right
+        up, _ = self.find_in_col(row, col)
+        if up:
+            up.down = curr.down
+        else:
+            self.col_heads[col] = curr.down
+        self.nnz -= 1
+        return f"Deleted element at ({row}, {col})."
+
+    def get(self, row, col):
+        """Value at (row, col), or 0 when it is not stored"""
+        _, curr = self.find_in_row(row, col)
+        return curr.val if curr and curr.col == col else 0
+
+    def row(self, row):
+        """Non-zero elements of one row as list of dicts"""
+        result = []
+        curr = self.row_heads[row]
+        while curr:
+            result.append({"row": curr.row, "col": curr.col, "val": curr.val})
+            curr = curr.right
+        return result
+
+    def column(self, col):
+        """Non-zero elements of one column as list of dicts"""
+        result = []
+        curr = self.col_heads[col]
+        while curr:
+            result.append({"row": curr.row, "col": curr.col, "val": curr.val})
+            curr = curr.down
+        return result
+
+    def iter_triplets(self):
+        """Yield (row, col, val) in row-major order"""
+        for head in self.row_heads:
+            curr = head
+            while curr:
+                yield curr.row, curr.col, curr.val
+                curr = curr.right
+
+    @classmethod
+    def from_triplets(cls, rows, cols, triplets):
+        """Build from (row, col, val) in row-major order, appending at each chain's tail"""
+        matrix = cls(rows, cols)
+        row_tails = [None] * rows
+        col_tails = [None] * cols
+        for row, col, val in triplets:
+            node = CrossNode(row, col, val)
+            if row_tails[row]:
+                row_tails[row].right = node
+            else:
+                matrix.row_heads[row] = node
+            row_tails[row] = node
+            if col_tails[col]:
+                col_tails[col].down = node
+            else:
+                matrix.col_heads[col] = node
+            col_tails[col] = node
+            matrix.nnz += 1
+        return matrix
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """Convert any other backend"""
+        triplets = matrix.iter_triplets()
+        if getattr(matrix, "order", "row") != "row":
+            triplets = sorted(triplets)
+        return cls.from_triplets(matrix.rows, matrix.cols, triplets)
+
+    def to_list(self):
+        """Return all non-zero elements as list of dicts (row-major)."""
+        return [{"row": row, "col": col, "val": val} for row, col, val in self.iter_triplets()]
+
+
 # ------------------------------
 # Flask App Setup
 # ------------------------------
-matrix = SparseMatrix(rows=5, cols=5)
+matrices = {
+    "linked": SparseMatrix(rows=5, cols=5),
+    "csr": CompressedSparseMatrix(rows=5, cols=5),
+    "csc": CompressedSparseMatrix(rows=5, cols=5, order="col"),
+    "orthogonal": OrthogonalSparseMatrix(rows=5, cols=5),
+}
+matrix = matrices["linked"]
+
+
+def selected_matrix():
+    """Matrix chosen by the ?backend= query parameter (default linked triplets)"""
+    return matrices.get(request.args.get('backend', 'linked'))
+
+
+def elements_payload(matrix):
+    """All elements, or one ?offset=&limit= window; a mapped matrix seeks straight to it.
+
+    Negative offset/limit values are clamped to 0.
+    """
+    offset = max(0, request.args.get('offset', default=0, type=int))
+    limit = request.args.get('limit', type=int)
+    if limit is not None:
+        limit = max(0, limit)
+    if limit is None and not offset:
+        return {"elements": matrix.to_list()}
+    if isinstance(matrix, MappedSparseMatrix):
+        elements = matrix.to_list(offset, limit)
+    else:
+        stop = None if limit is None else offset + limit
+        elements = [{"row": row, "col": col, "val": val}
+                    for row, col, val in islice(matrix.iter_triplets(), offset, stop)]
+    return {"offset": offset, "elements": elements}
+
+
+def matrix_path(name):
+    """Path of a .spmx file inside MATRIX_DIR, or None for any other name"""
+    if not name or os.path.basename(name) != name or not name.endswith(".spmx") or name == ".spmx":
+        return None
+    return os.path.join(app.config["MATRIX_DIR"], name)
+
+
+def convert(matrix, backend):
+    """Copy of matrix in the storage format of the named backend"""
+    if backend == "linked":
+        if isinstance(matrix, CompressedSparseMatrix):
+            return matrix.to_matrix()
+        return SparseMatrix.from_triplets(matrix.rows, matrix.cols, matrix.iter_triplets())
+    if backend == "orthogonal":
+        return OrthogonalSparseMatrix.from_matrix(matrix)
+    return CompressedSparseMatrix.from_matrix(matrix, "row" if backend == "csr" else "col")
 
 @app.route('/')
 def index():
@@ -98,6 +788,12 @@ def index():
         <h2>🧮 Sparse Matrix Visualization (Triplet Linked Representation)</h2>
 
         <div>
+            <select id="backend" onchange="refresh()">
+                <option value="linked">Linked Triplets</option>
+                <option value="csr">CSR Arrays</option>
+                <option value="csc">CSC Arrays</option>
+                <option value="orthogonal">Orthogonal List</option>
+            </select>
             <input type="number" id="row" placeholder="Row (0-based)" min="0">
             <input type="number" id="col" placeholder="Col (0-based)" min="0">
             <input type="number" id="val" placeholder="Value">
@@ -110,6 +806,16 @@ def index():
         <canvas id="canvas" width="1200" height="600"></canvas>
 
         <script>
+            function backend() {
+                return '&backend=' + document.getElementById("backend").value;
+            }
+
+            async function refresh() {
+                let res = await fetch('/status?' + backend());
+                let data = await res.json();
+                drawMatrix(data.elements);
+            }
+
             async function insert() {
                 let row = parseInt(document.getElementById("row").value);
                 let col = parseInt(document.getElementById("col").value);
@@ -118,7 +824,7 @@ def index():
                     alert("Please enter row, column, and value!");
                     return;
                 }
-                let res = await fetch(`/insert?row=${row}&col=${col}&val=${val}`);
+                let res = await fetch(`/insert?row=${row}&col=${col}&val=${val}` + backend());
                 let data = await res.json();
                 document.getElementById("status").innerText = data.message;
                 drawMatrix(data.elements);
@@ -131,7 +837,7 @@ def index():
                     alert("Please enter row and column!");
                     return;
                 }
-                let res = await fetch(`/delete?row=${row}&col=${col}`);
+                let res = await fetch(`/delete?row=${row}&col=${col}` + backend());
                 let data = await res.json();
                 document.getElementById("status").innerText = data.message;
                 drawMatrix(data.elements);
@@ -205,11 +911,7 @@ def index():
             }
 
             // Load initial matrix
-            window.onload = async function() {
-                let res = await fetch('/status');
-                let data = await res.json();
-                drawMatrix(data.elements);
-            };
+            window.onload = refresh;
         </script>
     </body>
     </html>
@@ -218,6 +920,9 @@ def index():
 
 @app.route('/insert')
 def insert():
+    matrix = selected_matrix()
+    if matrix is None:
+        return jsonify({"message": "Unknown matrix backend."}), 400
     row = request.args.get('row', type=int)
     col = request.args.get('col', type=int)
     val = request.args.get('val', type=int)
@@ -227,15 +932,259 @@ def insert():
 
 @app.route('/delete')
 def delete():
+    matrix = selected_matrix()
+    if matrix is None:
+        return jsonify({"message": "Unknown matrix backend."}), 400
     row = request.args.get('row', type=int)
     col = request.args.get('col', type=int)
     msg = matrix.delete(row, col)
     return jsonify({"message": msg, "elements": matrix.to_list()})
 
 
+@app.route('/get')
+def get_element():
+    matrix = selected_matrix()
+    if matrix is None:
+        return jsonify({"message": "Unknown matrix backend."}), 400
+    row = request.args.get('row', type=int)
+    col = request.args.get('col', type=int)
+    error = position_error(matrix, row, col)
+    if error:
+        return jsonify({"message": error}), 400
+    return jsonify({"row": row, "col": col, "val": matrix.get(row, col)})
+
+
+@app.route('/row')
+def get_row():
+    matrix = selected_matrix()
+    if matrix is None:
+        return jsonify({"message": "Unknown matrix backend."}), 400
+    row = request.args.get('row', type=int)
+    error = position_error(matrix, row=row)
+    if error:
+        return jsonify({"message": error}), 400
+    return jsonify({"elements": matrix.row(row)})
+
+
+@app.route('/column')
+def get_column():
+    matrix = selected_matrix()
+    if matrix is None:
+        return jsonify({"message": "Unknown matrix backend."}), 400
+    col = request.args.get('col', type=int)
+    error = position_error(matrix, col=col)
+    if error:
+        return jsonify({"message": error}), 400
+    return jsonify({"elements": matrix.column(col)})
+
+
+@app.route('/convert')
+def convert_matrix():
+    """Replace the ?to= backend with a copy of the ?backend= matrix"""
+    matrix = selected_matrix()
+    target = request.args.get('to')
+    if matrix is None or target not in matrices:
+        return jsonify({"message": "Unknown matrix backend."}), 400
+    if isinstance(matrices[target], MappedSparseMatrix):
+        return jsonify({"message": "Memory-mapped matrix is read-only."}), 400
+    try:
+        matrices[target] = convert(matrix, target)
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+    return jsonify({"message": f"Converted to {target}.", "elements": matrices[target].to_list()})
+
+
+def operand(name):
+    """Linked copy of the backend named by the ?name= query parameter"""
+    other = matrices.get(request.args.get(name, 'linked'))
+    return None if other is None else convert(other, "linked")
+
+
+def read_matrix_market(text):
+    """(row, col, val, shape) from a Matrix Market coordinate file (0-based indices)"""
+    lines = iter(text.splitlines())
+    header = next(lines, "").lower().split()
+    if len(header) < 5 or header[0] != "%%matrixmarket" or header[2] != "coordinate":
+        raise ValueError("Only Matrix Market coordinate files are supported.")
+    field, symmetry = header[3], header[4]
+    line = next(lines, "")
+    while line.startswith("%") or not line.strip():
+        line = next(lines)
+    n_rows, n_cols, nnz = (int(x) for x in line.split()[:3])
+    width = 2 if field == "pattern" else 3
+    tokens = " ".join(lines).split()
+    if len(tokens) != nnz * width:
+        raise ValueError(f"Expected {nnz} entries of {width} fields, found {len(tokens)} fields.")
+    row = [int(t) - 1 for t in tokens[0::width]]
+    col = [int(t) - 1 for t in tokens[1::width]]
+    if field == "pattern":
+        val = [1] * len(row)
+    elif field == "integer":
+        val = [int(t) for t in tokens[2::width]]
+    elif field == "real":
+        val = [float(t) for t in tokens[2::width]]
+    else:
+        raise ValueError(f"Unsupported Matrix Market field '{field}'.")
+    if symmetry in ("symmetric", "skew-symmetric"):
+        sign = -1 if symmetry == "skew-symmetric" else 1
+        mirrored = [(c, r, sign * v) for r, c, v in zip(row, col, val) if r != c]
+        row += [r for r, _, _ in mirrored]
+        col += [c for _, c, _ in mirrored]
+        val += [v for _, _, v in mirrored]
+    elif symmetry != "general":
+        raise ValueError(f"Unsupported Matrix Market symmetry '{symmetry}'.")
+    return row, col, val, (n_rows, n_cols)
+
+
+def read_npz(raw):
+    """(row, col, val, shape) from an .npz holding row/col/data (COO) or indptr/indices/data (CSR/CSC)"""
+    if np is None:
+        raise ValueError("NumPy is required to read .npz files.")
+    with np.load(io.BytesIO(raw), allow_pickle=False) as f:
+        files = set(f.files)
+        shape = tuple(int(x) for x in f["shape"]) if "shape" in files else None
+        data = f["data"] if "data" in files else f["val"]
+        if "indptr" in files:
+            indptr, indices = f["indptr"], f["indices"]
+            major = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+            fmt = f["format"].item() if "format" in files else "csr"
+            if isinstance(fmt, bytes):  # scipy's save_npz stores the format as a bytes scalar
+                fmt = fmt.decode()
+            if fmt not in ("csr", "csc"):
+                raise ValueError(f"Unsupported .npz format '{fmt}'.")
+            if fmt == "csc":
+                return indices, major, data, shape
+            return major, indices, data, shape
+        return f["row"], f["col"], data, shape
+
+
+def number(text):
+    """Parse a query value, keeping whole numbers as ints"""
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def result_payload(result, msg):
+    return {"message": msg, "rows": result.rows, "cols": result.cols, "elements": result.to_list()}
+
+
+@app.route('/upload', methods=['POST'])
+def upload():
+    """Replace the ?backend= matrix with a Matrix Market (.mtx) or .npz upload"""
+    backend = request.args.get('backend', 'linked')
+    if backend not in matrices:
+        return jsonify({"message": "Unknown matrix backend."}), 400
+    if isinstance(matrices[backend], MappedSparseMatrix):
+        return jsonify({"message": "Memory-mapped matrix is read-only."}), 400
+    upload = request.files.get('file')
+    raw = upload.read() if upload else request.get_data()
+    name = upload.filename if upload else ""
+    try:
+        if name.endswith('.npz') or raw.startswith(b'PK'):  # .npz is a zip archive
+            row, col, val, shape = read_npz(raw)
+        else:
+            row, col, val, shape = read_matrix_market(raw.decode())
+        loaded = SparseMatrix.from_coo(row, col, val, shape)
+        converted = loaded if backend == "linked" else convert(loaded, backend)
+    except (ValueError, KeyError, StopIteration, OSError, zipfile.BadZipFile) as e:
+        return jsonify({"message": f"Could not read matrix: {e}"}), 400
+    matrices[backend] = converted
+    return jsonify({"message": f"Loaded {loaded.rows}x{loaded.cols} matrix.", "rows": loaded.rows, "cols": loaded.cols})
+
+
+@app.route('/save')
+def save():
+    """Write the ?backend= matrix to ?name= in MATRIX_DIR in the memory-mappable format"""
+    matrix = selected_matrix()
+    name = request.args.get('name')
+    if matrix is None:
+        return jsonify({"message": "Unknown matrix backend."}), 400
+    path = matrix_path(name)
+    if path is None:
+        return jsonify({"message": "File name must be a plain name ending in .spmx."}), 400
+    try:
+        if not isinstance(matrix, CompressedSparseMatrix):
+            matrix = CompressedSparseMatrix.from_matrix(convert(matrix, "linked"))
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+    os.makedirs(app.config["MATRIX_DIR"], exist_ok=True)
+    matrix.save(path)
+    return jsonify({"message": f"Saved {matrix.nnz} non-zeros to {name}."})
+
+
+@app.route('/open')
+def open_mapped():
+    """Memory-map ?name= from MATRIX_DIR as the read-only "mapped" backend"""
+    path = matrix_path(request.args.get('name'))
+    if path is None:
+        return jsonify({"message": "File name must be a plain name ending in .spmx."}), 400
+    try:
+        mapped = MappedSparseMatrix(path)
+    except (OSError, ValueError) as e:
+        return jsonify({"message": f"Could not open matrix: {e}"}), 400
+    old = matrices.get("mapped")
+    matrices["mapped"] = mapped
+    if old is not None:
+        old.close()
+    return jsonify({"message": f"Mapped {mapped.rows}x{mapped.cols} matrix with {mapped.nnz} non-zeros.",
+                    "rows": mapped.rows, "cols": mapped.cols})
+
+
+@app.route('/add')
+def add():
+    matrix, other = operand('backend'), operand('other')
+    if matrix is None or other is None:
+        return jsonify({"message": "Unknown matrix backend."}), 400
+    try:
+        result = matrix.add(other)
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+    return jsonify(result_payload(result, "Computed matrix sum."))
+
+
+@app.route('/multiply')
+def multiply():
+    """?scalar=k scales, ?vector=1,0,2 is SpMV, otherwise SpGEMM by the ?other= backend"""
+    matrix = operand('backend')
+    if matrix is None:
+        return jsonify({"message": "Unknown matrix backend."}), 400
+    scalar = request.args.get('scalar')
+    vector = request.args.get('vector')
+    try:
+        if scalar is not None:
+            try:
+                k = number(scalar)
+            except ValueError:
+                return jsonify({"message": f"Invalid scalar '{scalar}'."}), 400
+            return jsonify(result_payload(matrix.scale(k), f"Scaled matrix by {k}."))
+        if vector is not None:
+            try:
+                values = [number(v) for v in vector.split(',') if v.strip()]
+            except ValueError:
+                return jsonify({"message": f"Invalid vector '{vector}'."}), 400
+            return jsonify({"message": "Computed matrix-vector product.", "vector": matrix.multiply(values)})
+        other = operand('other')
+        if other is None:
+            return jsonify({"message": "Unknown matrix backend."}), 400
+        return jsonify(result_payload(matrix.multiply(other), "Computed matrix product."))
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+
+@app.route('/transpose')
+def transpose():
+    matrix = operand('backend')
+    if matrix is None:
+        return jsonify({"message": "Unknown matrix backend."}), 400
+    return jsonify(result_payload(matrix.transpose(), "Computed transpose."))
+
+
 @app.route('/status')
 def status():
-    return jsonify({"elements": matrix.to_list()})
+    matrix = selected_matrix()
+    if matrix is None:
+        return jsonify({"message": "Unknown matrix backend."}), 400
+    return jsonify(elements_payload(matrix))
 
 
 # ------------------------------